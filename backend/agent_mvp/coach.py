@@ -24,7 +24,7 @@ from agent_mvp.contracts import (
     CoachingMessage,
 )
 from agent_mvp.storage import get_user_profile, get_gamification_state, get_recent_sessions
-from agent_mvp.gemini_client import GeminiClient
+from agent_mvp.gemini_client import get_gemini_client
 from agent_mvp.validators import validate_coach_output, fallback_coach
 from opik import track
 import logging
@@ -49,7 +49,7 @@ def generate_coaching_message(
     Returns:
         Coaching message
     """
-    logger.info(f"🏆 Generating coaching for user {user_id}")
+    logger.info("🏆 Generating coaching for user %s", user_id)
 
     # Gather context data
     user_profile = get_user_profile(user_id)
@@ -61,7 +61,7 @@ def generate_coaching_message(
 
     # Generate message with LLM
     try:
-        client = GeminiClient()
+        client = get_gemini_client()
         response = client.generate_json_response(prompt, max_tokens=200)
 
         # Validate response
@@ -73,7 +73,7 @@ def generate_coaching_message(
             message, category = fallback_coach(selected_task, context)
 
     except Exception as e:
-        logger.warning(f"⚠️ LLM coaching failed: {str(e)}")
+        logger.warning("⚠️ LLM coaching failed: %s", e)
         message, category = fallback_coach(selected_task, context)
 
     # Ensure bounds
@@ -85,7 +85,7 @@ def generate_coaching_message(
         category=category,
     )
 
-    logger.info(f"✅ Coaching generated: {category}")
+    logger.info("✅ Coaching generated: %s", category)
     return coaching
 
 
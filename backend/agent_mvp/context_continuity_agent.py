@@ -45,7 +45,7 @@ def resume_context(
     Returns:
         Context resumption data
     """
-    logger.info(f"🔄 Resuming context for user {request.user_id}")
+    logger.info("🔄 Resuming context for user %s", request.user_id)
 
     resumption = ContextResumption()
 
@@ -75,7 +75,7 @@ def resume_context(
     time_hints = _generate_time_hints(request.current_time)
     resumption.context_hints.extend(time_hints)
 
-    logger.info(f"✅ Context resumed with {len(resumption.context_hints)} hints")
+    logger.info("✅ Context resumed with %s hints", len(resumption.context_hints))
     return resumption
 
 
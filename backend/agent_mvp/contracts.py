@@ -3,7 +3,7 @@ Data contracts (Pydantic models) for agent MVP.
 """
 
 from pydantic import BaseModel, Field, field_validator
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Literal, Optional, Dict, Any, Union
 from datetime import datetime
 
 
@@ -99,10 +99,11 @@ class ActiveDo(BaseModel):
 
 class GraphState(BaseModel):
     """LangGraph state machine state."""
-    model_config = {"arbitrary_types_allowed": True}
+    model_config = {"arbitrary_types_allowed": True, "extra": "forbid"}
 
     user_id: str
     current_event: Optional[Any] = None
+    event_type_str: Optional[str] = None  # Resolved once from current_event
     candidates: List[TaskCandidate] = Field(default_factory=list)
     constraints: Optional[SelectionConstraints] = None
     active_do: Optional[Any] = None  # Can be dict or ActiveDo
@@ -406,6 +407,7 @@ class OrchestratorEvent(BaseModel):
 
 class AppOpenEvent(BaseModel):
     """App open event."""
+    event_type: Literal["APP_OPEN"] = "APP_OPEN"
     user_id: str
     timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
     device: Optional[str] = None
@@ -414,6 +416,7 @@ class AppOpenEvent(BaseModel):
 
 class CheckInSubmittedEvent(BaseModel):
     """Check-in submitted event."""
+    event_type: Literal["CHECKIN_SUBMITTED"] = "CHECKIN_SUBMITTED"
     user_id: str
     energy_level: int = Field(ge=1, le=10)
     focus_areas: List[str] = Field(default_factory=list)
@@ -441,6 +444,7 @@ class CheckInToConstraintsRequest(BaseModel):
 
 class DoNextEvent(BaseModel):
     """Do next event."""
+    event_type: Literal["DO_NEXT"] = "DO_NEXT"
     user_id: str
     timestamp: str
     context: str = Field(default="task_selection", description="Context for task selection")
@@ -449,6 +453,7 @@ class DoNextEvent(BaseModel):
 
 class DoActionEvent(BaseModel):
     """Do action event (start, complete, stuck)."""
+    event_type: Literal["DO_ACTION"] = "DO_ACTION"
     user_id: Optional[str] = None  # Set by endpoint from authenticated user
     action: str  # "start", "complete", "stuck", "pause"
     task_id: Optional[str] = None
@@ -459,6 +464,7 @@ class DoActionEvent(BaseModel):
 
 class DayEndEvent(BaseModel):
     """Day end event."""
+    event_type: Literal["DAY_END"] = "DAY_END"
     user_id: str
     timestamp: str
 
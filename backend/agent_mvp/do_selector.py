@@ -288,25 +288,27 @@ def select_optimal_task(
         fallback_id = _extract_task_id(fallback_task)
         return DoSelectorOutput(task_id=fallback_id, reason_codes=["fallback_direct"], alt_task_ids=[])
 
-    fitting = [
-        info
-        for info in candidate_infos
-        if info["duration"] <= max_minutes and info["energy_req"] <= current_energy
-    ]
-
-    selected_pool = fitting if fitting else candidate_infos
-    selected_pool_sorted = sorted(selected_pool, key=sort_key)
-    selected = selected_pool_sorted[0]
-
+    # One ordering serves the pick, the alternates and the log summary.
     overall_sorted = sorted(candidate_infos, key=sort_key)
+    selected = next(
+        (
+            info
+            for info in overall_sorted
+            if info["duration"] <= max_minutes and info["energy_req"] <= current_energy
+        ),
+        None,
+    )
+    used_fallback = selected is None
+    if used_fallback:
+        selected = overall_sorted[0]
+
     alt_task_ids = [
         info["task_id"]
-        for info in overall_sorted
+        for info in overall_sorted[:3]
         if info["task_id"] != selected["task_id"]
     ][:2]
 
     task_priority = _get_task_value(selected["task"], "priority", None)
-    used_fallback = not fitting
 
     reason_codes = []
     reason_codes.append("fallback_best_overall" if used_fallback else "constraints_fit")
@@ -318,7 +320,7 @@ def select_optimal_task(
         reason_codes.append("priority_preferred")
     reason_codes = reason_codes[:5]
 
-    top_candidates = sorted(candidate_infos, key=sort_key)[:3]
+    top_candidates = overall_sorted[:3]
     candidate_summaries = [
         {
             "id": info["task_id"],
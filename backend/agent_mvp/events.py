@@ -17,7 +17,6 @@ from typing import Dict, Any, List
 from datetime import datetime
 from agent_mvp.storage import log_agent_event
 from core.supabase import get_supabase
-from agent_mvp.contracts import AppOpenEvent, CheckInSubmittedEvent
 from opik import track
 import logging
 
@@ -33,7 +32,7 @@ def log_agent_start(agent_name: str, user_id: str, input_data: Dict[str, Any]) -
         "phase": "start",
     }
     log_agent_event(user_id, "agent_start", event_data)
-    logger.info(f"🚀 Agent {agent_name} started for user {user_id}")
+    logger.info("🚀 Agent %s started for user %s", agent_name, user_id)
 
 
 @track(name="events_log_agent_success")
@@ -46,7 +45,7 @@ def log_agent_success(agent_name: str, user_id: str, output_data: Dict[str, Any]
         "duration_ms": duration_ms,
     }
     log_agent_event(user_id, "agent_success", event_data)
-    logger.info(f"✅ Agent {agent_name} succeeded for user {user_id}")
+    logger.info("✅ Agent %s succeeded for user %s", agent_name, user_id)
 
 
 @track(name="events_log_agent_error")
@@ -59,7 +58,7 @@ def log_agent_error(agent_name: str, user_id: str, error: str, input_data: Dict[
         "phase": "error",
     }
     log_agent_event(user_id, "agent_error", event_data)
-    logger.error(f"❌ Agent {agent_name} failed for user {user_id}: {error}")
+    logger.error("❌ Agent %s failed for user %s: %s", agent_name, user_id, error)
 
 
 @track(name="events_log_user_action")
@@ -70,7 +69,7 @@ def log_user_action(user_id: str, action: str, metadata: Dict[str, Any] = None)
         "metadata": metadata or {},
     }
     log_agent_event(user_id, "user_action", event_data)
-    logger.info(f"👤 User {user_id} performed action: {action}")
+    logger.info("👤 User %s performed action: %s", user_id, action)
 
 
 @track(name="events_log_system_event")
@@ -83,7 +82,7 @@ def log_system_event(event_type: str, details: Dict[str, Any]) -> None:
         "details": details,
     }
     log_agent_event(system_user_id, "system_event", event_data)
-    logger.info(f"🔧 System event: {event_type}")
+    logger.info("🔧 System event: %s", event_type)
 
 
 @track(name="events_log_workflow_start")
@@ -95,7 +94,7 @@ def log_workflow_start(workflow_name: str, user_id: str, trigger_event: str) ->
         "phase": "start",
     }
     log_agent_event(user_id, "workflow_start", event_data)
-    logger.info(f"🔄 Workflow {workflow_name} started for user {user_id}")
+    logger.info("🔄 Workflow %s started for user %s", workflow_name, user_id)
 
 
 @track(name="events_log_workflow_complete")
@@ -109,7 +108,7 @@ def log_workflow_complete(workflow_name: str, user_id: str, success: bool, durat
     }
     log_agent_event(user_id, "workflow_complete", event_data)
     status = "✅" if success else "❌"
-    logger.info(f"{status} Workflow {workflow_name} completed for user {user_id}")
+    logger.info("%s Workflow %s completed for user %s", status, workflow_name, user_id)
 
 
 @track(name="events_log_task_selection")
@@ -128,7 +127,7 @@ def log_task_selection(
         "priority_score": priority_score,
     }
     log_agent_event(user_id, "task_selection", event_data)
-    logger.info(f"🎯 Task selected for user {user_id}: {selected_task_id}")
+    logger.info("🎯 Task selected for user %s: %s", user_id, selected_task_id)
 
 
 @track(name="events_log_stuck_detected")
@@ -147,7 +146,7 @@ def log_stuck_detected(
         "microtasks_provided": microtasks_count,
     }
     log_agent_event(user_id, "stuck_detected", event_data)
-    logger.info(f"🕳️ Stuck detected for user {user_id} on task {task_id}")
+    logger.info("🕳️ Stuck detected for user %s on task %s", user_id, task_id)
 
 
 @track(name="events_log_gamification_update")
@@ -166,7 +165,7 @@ def log_gamification_update(
         "streak_change": streak_change,
     }
     log_agent_event(user_id, "gamification_update", event_data)
-    logger.info(f"🎮 Gamification updated for user {user_id}: +{xp_gained} XP")
+    logger.info("🎮 Gamification updated for user %s: +%s XP", user_id, xp_gained)
 
 
 @track(name="events_log_insight_generated")
@@ -183,7 +182,7 @@ def log_insight_generated(
         "project_id": project_id,
     }
     log_agent_event(user_id, "insight_generated", event_data)
-    logger.info(f"💡 Insights generated for user {user_id}: {insight_count} {insight_type}")
+    logger.info("💡 Insights generated for user %s: %s %s", user_id, insight_count, insight_type)
 
 
 @track(name="events_log_motivation_sent")
@@ -200,7 +199,7 @@ def log_motivation_sent(
         "message_length": message_length,
     }
     log_agent_event(user_id, "motivation_sent", event_data)
-    logger.info(f"💪 Motivation sent to user {user_id}: {category}")
+    logger.info("💪 Motivation sent to user %s: %s", user_id, category)
 
 
 def create_event_wrapper(agent_name: str):
@@ -250,24 +249,15 @@ class EventLogger:
             "metadata": {"version": "1.0"},
         }
 
-        if isinstance(event, AppOpenEvent):
+        # Known events carry their wire type as an event_type tag.
+        base["event_type"] = getattr(event, "event_type", "UNKNOWN")
+        base["user_id"] = getattr(event, "user_id", None)
+        if base["event_type"] == "CHECKIN_SUBMITTED":
             base.update({
-                "event_type": "APP_OPEN",
-                "user_id": event.user_id,
-            })
-        elif isinstance(event, CheckInSubmittedEvent):
-            base.update({
-                "event_type": "CHECKIN_SUBMITTED",
-                "user_id": event.user_id,
                 "energy_level": event.energy_level,
                 "focus_areas": event.focus_areas,
                 "time_available": event.time_available,
             })
-        else:
-            base.update({
-                "event_type": getattr(event, "event_type", "UNKNOWN"),
-                "user_id": getattr(event, "user_id", None),
-            })
 
         return base
 
@@ -286,7 +276,7 @@ class EventLogger:
             supabase.table("agent_events").insert(insert_payload).execute()
             return True
         except Exception as e:
-            logger.error(f"❌ Failed to log event: {str(e)}")
+            logger.error("❌ Failed to log event: %s", e)
             return False
 
     async def log_events(self, events: List[Any]) -> List[bool]:
@@ -310,7 +300,7 @@ class EventLogger:
             )
             return result.data or []
         except Exception as e:
-            logger.error(f"❌ Failed to get user events: {str(e)}")
+            logger.error("❌ Failed to get user events: %s", e)
             return []
 
     async def get_events_by_type(self, user_id: str, event_type: str) -> List[Dict[str, Any]]:
@@ -327,7 +317,7 @@ class EventLogger:
             )
             return result.data or []
         except Exception as e:
-            logger.error(f"❌ Failed to get events by type: {str(e)}")
+            logger.error("❌ Failed to get events by type: %s", e)
             return []
 
     async def get_system_events(self) -> List[Dict[str, Any]]:
@@ -343,5 +333,5 @@ class EventLogger:
             )
             return result.data or []
         except Exception as e:
-            logger.error(f"❌ Failed to get system events: {str(e)}")
+            logger.error("❌ Failed to get system events: %s", e)
             return []
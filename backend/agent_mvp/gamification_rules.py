@@ -84,7 +84,7 @@ def update_gamification(
     Returns:
         Gamification update details
     """
-    logger.info(f"🎮 Processing gamification for user {user_id}, action: {action}")
+    logger.info("🎮 Processing gamification for user %s, action: %s", user_id, action)
 
     # Get current state
     current_state = get_gamification_state(user_id) or _initialize_gamification_state(user_id)
@@ -109,7 +109,7 @@ def update_gamification(
         current_streak=updated_state.current_streak,
     )
 
-    logger.info(f"✅ Gamification updated: +{xp_gained} XP, level {updated_state.level}, streak {updated_state.current_streak}")
+    logger.info("✅ Gamification updated: +%s XP, level %s, streak %s", xp_gained, updated_state.level, updated_state.current_streak)
     return update
 
 
@@ -227,9 +227,9 @@ def _log_xp_transaction(
             "timestamp": datetime.utcnow(),
         }
         save_xp_ledger_entry(entry)
-        logger.info(f"📝 XP transaction logged: {action} +{xp_gained} XP")
+        logger.info("📝 XP transaction logged: %s +%s XP", action, xp_gained)
     except Exception as e:
-        logger.warning(f"⚠️ Failed to log XP transaction: {str(e)}")
+        logger.warning("⚠️ Failed to log XP transaction: %s", e)
 
 
 def get_level_progress(user_id: str) -> Dict[str, Any]:
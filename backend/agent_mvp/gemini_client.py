@@ -5,13 +5,19 @@ Provides a simple interface to call Gemini models with automatic observability.
 
 import json
 import os
+import threading
 from typing import Optional, Dict, Any
 from google import genai
 from opik import track
+from core.config import get_settings
+from agent_mvp.ttl_cache import TTLCache
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Cached responses per client; oldest entries are evicted past this size.
+RESPONSE_CACHE_SIZE = 1024
+
 
 class GeminiClient:
     """
@@ -19,13 +25,19 @@ class GeminiClient:
     Uses environment variable GOOGLE_API_KEY.
     """
 
-    def __init__(self, api_key: Optional[str] = None, model: str = "gemini-2.5-flash-lite"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "gemini-2.5-flash-lite",
+        max_concurrency: Optional[int] = None,
+    ):
         """
         Initialize Gemini client.
 
         Args:
             api_key: Google API key (defaults to GOOGLE_API_KEY env var)
             model: Model name (default: gemini-2.5-flash-lite)
+            max_concurrency: Max in-flight requests (defaults to AGENT_LLM_CONCURRENCY)
         """
         self.api_key = api_key or os.getenv("GOOGLE_API_KEY")
         if not self.api_key:
@@ -33,7 +45,26 @@ class GeminiClient:
 
         self.model = model
         self.client = genai.Client(api_key=self.api_key)
-        logger.info(f"✅ GeminiClient initialized with model: {self.model}")
+        # Agent events run on worker threads; cap how many reach the API at once.
+        self._slots = threading.BoundedSemaphore(
+            max_concurrency or get_settings().agent_llm_concurrency
+        )
+        # (kind, prompt, temperature, max_tokens) -> validated response text for
+        # callers that pass cache=True; a TTL of 0 disables it.
+        self._cache = TTLCache(get_settings().agent_llm_cache_ttl, RESPONSE_CACHE_SIZE)
+        logger.info("✅ GeminiClient initialized with model: %s", self.model)
+
+    def _generate_content(self, prompt: str, temperature: float, max_tokens: int) -> Any:
+        """Send one generate_content request, waiting for a free slot."""
+        with self._slots:
+            return self.client.models.generate_content(
+                model=self.model,
+                contents=prompt,
+                config={
+                    "temperature": temperature,
+                    "max_output_tokens": max_tokens,
+                },
+            )
 
     @track(name="gemini_call")
     def generate_json_response(
@@ -42,6 +73,7 @@ class GeminiClient:
         expected_format: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: int = 1024,
+        cache: bool = False,
     ) -> Dict[str, Any]:
         """
         Call Gemini and expect JSON-only response.
@@ -52,6 +84,7 @@ class GeminiClient:
             expected_format: Optional description of expected JSON format (for prompt)
             temperature: Sampling temperature (0.0-1.0)
             max_tokens: Max output tokens
+            cache: Reuse a recent valid answer to the same request (see AGENT_LLM_CACHE_TTL)
 
         Returns:
             Parsed JSON dict
@@ -64,15 +97,12 @@ class GeminiClient:
             if "json" not in prompt.lower():
                 prompt += "\n\nRespond ONLY with valid JSON. No other text."
 
-            response = self.client.models.generate_content(
-                model=self.model,
-                contents=prompt,
-                config={
-                    "temperature": temperature,
-                    "max_output_tokens": max_tokens,
-                },
-            )
+            key = ("json", prompt, temperature, max_tokens)
+            cached = self._cache.get(key) if cache and self._cache.ttl else None
+            if cached is not None:
+                return json.loads(cached)
 
+            response = self._generate_content(prompt, temperature, max_tokens)
             response_text = response.text.strip()
 
             # Try to extract JSON from response
@@ -92,15 +122,17 @@ class GeminiClient:
                     response_text = "\n".join(json_lines)
 
                 parsed = json.loads(response_text)
-                logger.info(f"✅ Valid JSON response: {parsed}")
+                logger.debug("✅ Valid JSON response: %s", parsed)
+                if cache and self._cache.ttl:
+                    self._cache.set(key, response_text)
                 return parsed
 
             except json.JSONDecodeError as e:
-                logger.error(f"❌ Invalid JSON from Gemini: {response_text[:200]}")
+                logger.error("❌ Invalid JSON from Gemini: %s", response_text[:200])
                 raise ValueError(f"Gemini response is not valid JSON: {str(e)}")
 
         except Exception as e:
-            logger.error(f"❌ Gemini API error: {str(e)}")
+            logger.error("❌ Gemini API error: %s", e)
             raise
 
     @track(name="gemini_text_call")
@@ -109,6 +141,7 @@ class GeminiClient:
         prompt: str,
         temperature: float = 0.7,
         max_tokens: int = 500,
+        cache: bool = False,
     ) -> str:
         """
         Call Gemini and return raw text response.
@@ -117,29 +150,30 @@ class GeminiClient:
             prompt: Full prompt
             temperature: Sampling temperature
             max_tokens: Max output tokens
+            cache: Reuse a recent answer to the same request (see AGENT_LLM_CACHE_TTL)
 
         Returns:
             Plain text response
         """
         try:
-            response = self.client.models.generate_content(
-                model=self.model,
-                contents=prompt,
-                config={
-                    "temperature": temperature,
-                    "max_output_tokens": max_tokens,
-                },
-            )
+            key = ("text", prompt, temperature, max_tokens)
+            cached = self._cache.get(key) if cache and self._cache.ttl else None
+            if cached is not None:
+                return cached
 
-            return response.text.strip()
+            text = self._generate_content(prompt, temperature, max_tokens).text.strip()
+            if cache and self._cache.ttl:
+                self._cache.set(key, text)
+            return text
 
         except Exception as e:
-            logger.error(f"❌ Gemini API error: {str(e)}")
+            logger.error("❌ Gemini API error: %s", e)
             raise
 
 
 # Singleton instance
 _gemini_client: Optional[GeminiClient] = None
+_gemini_client_lock = threading.Lock()
 
 
 def get_gemini_client() -> GeminiClient:
@@ -148,5 +182,8 @@ def get_gemini_client() -> GeminiClient:
     """
     global _gemini_client
     if _gemini_client is None:
-        _gemini_client = GeminiClient()
+        # Agents call this from worker threads; build the client only once.
+        with _gemini_client_lock:
+            if _gemini_client is None:
+                _gemini_client = GeminiClient()
     return _gemini_client
@@ -35,7 +35,7 @@ def load_candidates(state: GraphState) -> GraphState:
     Load candidate tasks from Supabase for the user.
     Filters for open (non-completed) tasks only.
     """
-    logger.info(f"📥 Loading candidates for user {state.user_id}")
+    logger.info("📥 Loading candidates for user %s", state.user_id)
 
     try:
         supabase = get_supabase_admin()
@@ -53,7 +53,7 @@ def load_candidates(state: GraphState) -> GraphState:
         )
 
         if not response.data:
-            logger.warning(f"⚠️  No open tasks found for user {state.user_id}")
+            logger.warning("⚠️  No open tasks found for user %s", state.user_id)
             state.error = "No open tasks available"
             return state
 
@@ -82,11 +82,11 @@ def load_candidates(state: GraphState) -> GraphState:
             candidates.append(candidate)
 
         state.candidates = candidates
-        logger.info(f"✅ Loaded {len(candidates)} candidate tasks")
+        logger.info("✅ Loaded %s candidate tasks", len(candidates))
         return state
 
     except Exception as e:
-        logger.error(f"❌ Error loading candidates: {str(e)}")
+        logger.error("❌ Error loading candidates: %s", e)
         state.error = f"Failed to load tasks: {str(e)}"
         return state
 
@@ -96,7 +96,7 @@ def derive_constraints(state: GraphState) -> GraphState:
     """
     Derive selection constraints from latest daily_check_in or use defaults.
     """
-    logger.info(f"⚙️  Deriving constraints for user {state.user_id}")
+    logger.info("⚙️  Deriving constraints for user %s", state.user_id)
 
     try:
         supabase = get_supabase_admin()
@@ -125,13 +125,13 @@ def derive_constraints(state: GraphState) -> GraphState:
             )
 
         logger.info(
-            f"✅ Constraints: energy={state.constraints.current_energy}, "
-            f"mode={state.constraints.mode}, max_time={state.constraints.max_minutes}min"
+            "✅ Constraints: energy=%s, mode=%s, max_time=%smin",
+            state.constraints.current_energy, state.constraints.mode, state.constraints.max_minutes,
         )
         return state
 
     except Exception as e:
-        logger.error(f"❌ Error deriving constraints: {str(e)}")
+        logger.error("❌ Error deriving constraints: %s", e)
         # Use defaults
         state.constraints = SelectionConstraints()
         return state
@@ -173,11 +173,11 @@ def llm_select_do(state: GraphState) -> GraphState:
             alt_task_ids=selector_output.alt_task_ids,
         )
 
-        logger.info(f"✅ Selected task: {selected_task.title}")
+        logger.info("✅ Selected task: %s", selected_task.title)
         return state
 
     except Exception as e:
-        logger.error(f"❌ DoSelector error: {str(e)}")
+        logger.error("❌ DoSelector error: %s", e)
         state.error = f"Selection failed: {str(e)}"
         return state
 
@@ -200,11 +200,11 @@ def llm_coach(state: GraphState) -> GraphState:
         )
 
         state.coach_message = coach_output
-        logger.info(f"✅ Coach message ready: '{coach_output.title}'")
+        logger.info("✅ Coach message ready: '%s'", coach_output.title)
         return state
 
     except Exception as e:
-        logger.error(f"❌ Coach error: {str(e)}")
+        logger.error("❌ Coach error: %s", e)
         state.error = f"Coaching failed: {str(e)}"
         return state
 
@@ -265,7 +265,7 @@ async def run_agent_mvp(
     Returns:
         Response dict with {success, data, error}
     """
-    logger.info(f"🚀 Starting agent MVP for user {user_id}")
+    logger.info("🚀 Starting agent MVP for user %s", user_id)
 
     # Initialize state
     state = GraphState(
@@ -291,6 +291,6 @@ async def run_agent_mvp(
         return return_result(state)
 
     result = return_result(state)
-    logger.info(f"✅ Agent MVP complete: {result['success']}")
+    logger.info("✅ Agent MVP complete: %s", result['success'])
 
     return result
@@ -0,0 +1,37 @@
+"""
+I/O pool helper - run independent agent calls on a thread pool.
+
+Each call runs in a copy of the caller's context, so opik spans opened in a
+worker nest under the current trace instead of starting a detached one.
+"""
+
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional
+
+
+def run_independent(
+    pool: Optional[ThreadPoolExecutor],
+    *calls: Callable[[], Any],
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """Run independent calls, concurrently on `pool` if one is given.
+
+    Results are returned in call order. The first failure is re-raised
+    unless `return_exceptions` is set, in which case a failed call's
+    exception takes its place in the results.
+    """
+    if pool is None:
+        results = []
+        for call in calls:
+            try:
+                results.append(call())
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+        return results
+    futures = [pool.submit(contextvars.copy_context().run, call) for call in calls]
+    if not return_exceptions:
+        return [future.result() for future in futures]
+    return [future.exception() or future.result() for future in futures]
@@ -40,7 +40,7 @@ def generate_coaching_message(
         is_valid=False means a minimal fallback was used
     """
 
-    logger.info(f"🧠 Coach: Generating message for task '{task.title}'")
+    logger.info("🧠 Coach: Generating message for task '%s'", task.title)
 
     try:
         # Build prompt
@@ -58,14 +58,14 @@ def generate_coaching_message(
         output, is_valid = validate_coach_output(raw_response)
 
         if is_valid:
-            logger.info(f"✅ Coach message generated: '{output.title}'")
+            logger.info("✅ Coach message generated: '%s'", output.title)
         else:
-            logger.warning(f"⚠️  Used fallback coach message")
+            logger.warning("⚠️  Used fallback coach message")
 
         return output, is_valid
 
     except Exception as e:
-        logger.error(f"❌ Coach error: {str(e)}")
+        logger.error("❌ Coach error: %s", e)
         # Use minimal fallback
         fallback = CoachOutput(
             title="Let's go",
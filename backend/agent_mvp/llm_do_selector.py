@@ -41,7 +41,7 @@ def select_task(
     if not candidates:
         raise ValueError("At least one candidate task required")
 
-    logger.info(f"🤖 DoSelector: Selecting from {len(candidates)} candidates")
+    logger.info("🤖 DoSelector: Selecting from %s candidates", len(candidates))
 
     try:
         # Build prompt
@@ -59,14 +59,14 @@ def select_task(
         output, is_valid = validate_do_selector_output(raw_response, candidates)
 
         if is_valid:
-            logger.info(f"✅ Selected task: {output.task_id}")
+            logger.info("✅ Selected task: %s", output.task_id)
         else:
-            logger.warning(f"⚠️  Used fallback selection: {output.task_id}")
+            logger.warning("⚠️  Used fallback selection: %s", output.task_id)
 
         return output, is_valid
 
     except Exception as e:
-        logger.error(f"❌ DoSelector error: {str(e)}")
+        logger.error("❌ DoSelector error: %s", e)
         # Use fallback on any error
         fallback_output, _ = validate_do_selector_output({}, candidates)
         return fallback_output, False
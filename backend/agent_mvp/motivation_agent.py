@@ -25,7 +25,7 @@ from agent_mvp.contracts import (
     MotivationResponse,
 )
 from agent_mvp.storage import get_gamification_state, get_recent_sessions, get_user_profile
-from agent_mvp.gemini_client import GeminiClient
+from agent_mvp.gemini_client import get_gemini_client
 from opik import track
 import logging
 
@@ -45,7 +45,7 @@ def generate_motivation(
     Returns:
         Motivation response with bounded message
     """
-    logger.info(f"💪 Generating motivation for user {request.user_id}")
+    logger.info("💪 Generating motivation for user %s", request.user_id)
 
     # Gather context data
     gamification = get_gamification_state(request.user_id)
@@ -66,7 +66,7 @@ def generate_motivation(
         category=category,
     )
 
-    logger.info(f"✅ Generated {category} motivation message")
+    logger.info("✅ Generated %s motivation message", category)
     return response
 
 
@@ -104,7 +104,7 @@ def _gather_motivation_data(
 def _generate_motivation_message(data: Dict[str, Any], tone: str) -> str:
     """Generate bounded motivation message using LLM."""
     try:
-        client = GeminiClient()
+        client = get_gemini_client()
 
         prompt = f"""
         Generate a short, encouraging motivation message based on this user data:
@@ -139,7 +139,7 @@ def _generate_motivation_message(data: Dict[str, Any], tone: str) -> str:
         return _generate_fallback_message(data, tone)
 
     except Exception as e:
-        logger.warning(f"⚠️ LLM motivation generation failed: {str(e)}")
+        logger.warning("⚠️ LLM motivation generation failed: %s", e)
         return _generate_fallback_message(data, tone)
 
 
@@ -20,9 +20,18 @@ Critical guarantees:
 - comprehensive error handling with fallbacks
 """
 
-from typing import Dict, Any, List, Optional
-from datetime import datetime
-from langgraph.graph import StateGraph, END
+from typing import TYPE_CHECKING, Dict, Any, Callable, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import cached_property, lru_cache
+import asyncio
+import atexit
+import heapq
+import queue
+import threading
+import time
+from pydantic import TypeAdapter
+from core.config import get_settings
 from core.supabase import get_supabase
 from agent_mvp.contracts import (
     GraphState,
@@ -30,6 +39,7 @@ from agent_mvp.contracts import (
     AppOpenEvent,
     CheckInSubmittedEvent,
     CheckInToConstraintsRequest,
+    UserProfileAnalyzeRequest,
     DoNextEvent,
     DoActionEvent,
     DayEndEvent,
@@ -40,11 +50,11 @@ from agent_mvp.contracts import (
     ActiveDo,
     CoachOutput,
 )
-from agent_mvp.user_profile_agent import analyze_user_profile
 from agent_mvp.state_adapter_agent import adapt_checkin_to_constraints
 from agent_mvp.priority_engine_agent import score_task_priorities
 from agent_mvp.do_selector import select_optimal_task
 from agent_mvp.context_continuity_agent import resume_context
+from agent_mvp.user_profile_agent import analyze_user_profile
 from agent_mvp.stuck_pattern_agent import detect_stuck_patterns
 from agent_mvp.project_insight_agent import generate_project_insights
 from agent_mvp.motivation_agent import generate_motivation
@@ -53,17 +63,170 @@ from agent_mvp.llm_do_selector import select_task as llm_select_task
 from agent_mvp.llm_coach import generate_coaching_message as llm_generate_coaching_message
 from agent_mvp.storage import (
     get_task_candidates,
-    save_active_do,
+    finalize_selection,
+    log_agent_events,
     update_session_status,
     save_session_insights,
-    get_user_checkins,
 )
 from agent_mvp.events import log_agent_event
+from agent_mvp.io_pool import run_independent
+from agent_mvp.ttl_cache import TTLCache
 from opik import track
 import logging
 
+if TYPE_CHECKING:
+    from langchain_core.runnables import RunnableConfig
+    from langgraph.graph import StateGraph
+    from langgraph.types import Command
+
 logger = logging.getLogger(__name__)
 
+# Upper bound on candidates forwarded to the LLM selector (prompt size is O(K)).
+MAX_LLM_CANDIDATES = 10
+
+_PRIORITY_RANK = {"urgent": 4, "high": 3, "medium": 2, "low": 1}
+
+# Request templates for the fixed-shape agent calls; handlers copy and fill user_id.
+_MOTIVATION_TASK_COMPLETE = {"user_id": None, "context": "task_completion", "tone": "celebratory"}
+_MOTIVATION_DAY_END = {"user_id": None, "context": "day_completion", "tone": "reflective"}
+_INSIGHTS_WEEKLY_PROGRESS = {"insight_type": "progress", "time_range": "week"}
+
+# Background storage writer: flush after this many queued writes or this many seconds.
+WRITE_BATCH_SIZE = 64
+WRITE_FLUSH_INTERVAL = 1.0
+
+# Cached task-candidate lists per user; oldest entries are evicted past this size.
+CANDIDATE_CACHE_SIZE = 4096
+
+# Cached check-ins per user; oldest entries are evicted past this size.
+CHECKIN_CACHE_SIZE = 1024
+
+# Queued agent events are coalesced into one storage.log_agent_events insert per batch.
+_AGENT_EVENT_WRITE = "log_agent_event"
+
+# Queued active_do saves are coalesced (latest per user) into one storage.save_active_dos upsert.
+_ACTIVE_DO_WRITE = "save_active_do"
+
+# Event class -> wire event type, read from each contract's event_type tag.
+_EVENT_TYPE_BY_CLASS: Dict[type, str] = {
+    cls: cls.model_fields["event_type"].default
+    for cls in (AppOpenEvent, CheckInSubmittedEvent, DoNextEvent, DoActionEvent, DayEndEvent)
+}
+_VALID_EVENT_TYPES = frozenset(_EVENT_TYPE_BY_CLASS.values())
+
+
+# Wire event type -> graph route name.
+_EVENT_ROUTES = {
+    "APP_OPEN": "app_open",
+    "CHECKIN_SUBMITTED": "checkin_submitted",
+    "DO_NEXT": "do_next",
+    "DO_ACTION": "do_action",
+    "DAY_END": "day_end",
+}
+
+# Route name -> graph node the start node jumps to.
+_ROUTE_NODES = {
+    "app_open": "handle_app_open",
+    "checkin_submitted": "handle_checkin",
+    "do_next": "handle_do_next",
+    "do_action": "handle_do_action",
+    "day_end": "handle_day_end",
+    "error": "return_result",
+}
+
+_RESPONSE_ADAPTER = TypeAdapter(AgentMVPResponse)
+_TASK_CANDIDATES_ADAPTER = TypeAdapter(List[TaskCandidate])
+
+
+@lru_cache(maxsize=None)
+def _adapter_for(model_cls: type) -> TypeAdapter:
+    """Cached TypeAdapter per response submodel class."""
+    return TypeAdapter(model_cls)
+
+
+def _dump_model(value: Any) -> Dict[str, Any]:
+    return _adapter_for(type(value)).dump_python(value)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _dump_if_model(value: Any) -> Any:
+    return _dump_model(value) if hasattr(value, "model_dump") else value
+
+
+def _dump_list(values: List[Any]) -> List[Any]:
+    # Producers return all models or all dicts, so the head decides for the list.
+    if not hasattr(values[0], "model_dump"):
+        return list(values)
+    dump = _adapter_for(type(values[0])).dump_python
+    return [dump(v) for v in values]
+
+
+# (GraphState attribute, response key, serializer); falsy values are skipped.
+_RESPONSE_FIELDS = (
+    ("context_resumption", "context_resumption", _identity),        # APP_OPEN
+    ("selection_constraints", "selection_constraints", _identity),  # CHECKIN_SUBMITTED
+    ("user_profile", "user_profile", _identity),
+    ("active_do", "active_do", _identity),                          # DO_NEXT
+    ("coach_message", "coach_message", _dump_if_model),
+    ("motivation_message", "motivation_message", _dump_if_model),   # DO_ACTION:complete, DAY_END
+    ("stuck_analysis", "stuck_analysis", _dump_if_model),           # DO_ACTION:stuck
+    ("microtasks", "microtasks", _dump_list),
+    ("day_insights", "day_insights", _dump_list),                   # DAY_END
+)
+
+
+@lru_cache(maxsize=1024)
+def _cached_checkin_constraints(
+    user_id: str,
+    date: str,
+    energy_level: int,
+    focus_areas: tuple,
+    mood: Optional[Any],
+    sleep_quality: Optional[Any],
+    focus_minutes: Optional[int],
+    day_of_week: int,
+) -> SelectionConstraints:
+    """Adapt one check-in to constraints; memoized on the fields that shape the result."""
+    check_in = DailyCheckIn(
+        date=date,
+        energy_level=energy_level,
+        mood=mood,
+        sleep_quality=sleep_quality,
+        focus_minutes=focus_minutes,
+        context=None,
+        priorities=list(focus_areas),
+        day_of_week=day_of_week,
+    )
+    return adapt_checkin_to_constraints(CheckInToConstraintsRequest(
+        user_id=user_id,
+        energy_level=energy_level,
+        focus_areas=list(focus_areas),
+        check_in_data=check_in,
+        user_profile=UserProfileAnalysis(),
+    ))
+
+
+def _build_constraints_from_checkin(
+    user_id: str,
+    checkin: Dict[str, Any],
+    today_iso: str,
+    day_of_week: int,
+) -> SelectionConstraints:
+    """Selection constraints for a daily_check_ins row (a private copy of the cached result)."""
+    return _cached_checkin_constraints(
+        user_id,
+        checkin.get("date", today_iso),
+        checkin.get("energy_level", 5),
+        tuple(checkin.get("focus_areas") or ()),
+        checkin.get("mood"),
+        checkin.get("sleep_quality"),
+        checkin.get("focus_minutes"),
+        day_of_week,
+    ).model_copy()
+
 
 def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
     if not value:
@@ -74,33 +237,121 @@ def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
         return None
 
 
+def _task_candidate_fields(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a raw Supabase task row onto TaskCandidate fields."""
+    due_at = task.get("due_at") or task.get("deadline")
+    return {
+        "id": str(task.get("id")),
+        "title": task.get("title") or "Untitled task",
+        "priority": task.get("priority", "medium"),
+        "status": task.get("status", "todo"),
+        "estimated_duration": task.get("estimated_duration") or task.get("estimated_minutes"),
+        "due_at": _parse_datetime(due_at),
+        "tags": task.get("tags") or [],
+        "created_at": _parse_datetime(task.get("created_at")),
+    }
+
+
 def _to_task_candidate(task: Dict[str, Any]) -> TaskCandidate:
     """Coerce raw Supabase task into TaskCandidate model."""
-    due_at = task.get("due_at") or task.get("deadline")
-    candidate = TaskCandidate(
-        id=str(task.get("id")),
-        title=task.get("title") or "Untitled task",
-        priority=task.get("priority", "medium"),
-        status=task.get("status", "todo"),
-        estimated_duration=task.get("estimated_duration") or task.get("estimated_minutes"),
-        due_at=_parse_datetime(due_at),
-        tags=task.get("tags") or [],
-        created_at=_parse_datetime(task.get("created_at")),
+    return TaskCandidate(**_task_candidate_fields(task))
+
+
+def _to_task_candidates(tasks: List[Dict[str, Any]]) -> List[TaskCandidate]:
+    """Coerce raw tasks in one validation pass; rows that fail are dropped individually."""
+    try:
+        return _TASK_CANDIDATES_ADAPTER.validate_python([_task_candidate_fields(t) for t in tasks])
+    except Exception:
+        pass
+
+    task_models = []
+    for raw in tasks:
+        try:
+            task_models.append(_to_task_candidate(raw))
+        except Exception as err:
+            logger.warning("Failed to coerce task candidate (non-blocking): %s", err)
+    return task_models
+
+
+def _candidate_rank_key(task: TaskCandidate) -> tuple:
+    """Cheap deterministic ordering: priority desc, due date asc, duration asc."""
+    due_ts = task.due_at.timestamp() if task.due_at else float("inf")
+    return (
+        -_PRIORITY_RANK.get(task.priority, 0),
+        due_ts,
+        task.estimated_duration or 999,
+        task.id,
     )
-    return candidate
 
 
-def get_calendar_context(user_id: str) -> Optional[Dict[str, Any]]:
+def _shortlist_candidates(
+    task_models: List[TaskCandidate],
+    limit: int = MAX_LLM_CANDIDATES,
+) -> List[TaskCandidate]:
+    """Return the top-`limit` candidates for the LLM prompt (O(N log K))."""
+    if len(task_models) <= limit:
+        return task_models
+    return heapq.nsmallest(limit, task_models, key=_candidate_rank_key)
+
+
+def _skip_log_event(event: Any) -> None:
+    """Default `events.log_event` hook when no events agent is injected."""
+
+
+def _no_candidates(request: Dict[str, Any]) -> List[Any]:
+    """Default `priority_engine_agent.process` hook: nothing to rank."""
+    return []
+
+
+def _no_selection(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Default `do_selector.select_task` hook: no task selected."""
+    return {"task": None, "reason": ""}
+
+
+def _drop_write(*args: Any) -> None:
+    """Storage write with no backend to receive it."""
+
+
+class _NullStorage:
+    """Storage used when none is set: writes are dropped.
+
+    Session status, do_next's selection and agent events still go to the
+    storage module, as handlers always recorded them even without an
+    injected backend.
+    """
+
+    def update_session_status(self, task_id: str, status: str) -> None:
+        update_session_status(task_id, status)
+
+    def finalize_selection(
+        self, active_do: Dict[str, Any], agent_event: Optional[Dict[str, Any]] = None
+    ) -> None:
+        finalize_selection(active_do, agent_event)
+
+    def log_agent_events(self, events: List[Dict[str, Any]]) -> None:
+        log_agent_events(events)
+
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        return _drop_write
+
+
+_NULL_STORAGE = _NullStorage()
+
+
+def get_calendar_context(user_id: str, now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
     """
     Fetch today's calendar context for AI decision making.
     Returns None if calendar is not connected.
+
+    `now` lets the caller share its request clock; defaults to the current UTC time.
     """
     try:
         from core.supabase import get_supabase_admin
-        from datetime import date, timedelta, timezone
+        from datetime import timedelta
 
         supabase = get_supabase_admin()
-        today = date.today()
+        now = now or datetime.now(timezone.utc)
+        today = now.date()
         tomorrow = today + timedelta(days=1)
 
         # Check if user has calendar connected
@@ -142,7 +393,6 @@ def get_calendar_context(user_id: str) -> Optional[Dict[str, Any]]:
 
         # Find free time blocks for task recommendations
         free_blocks = []
-        now = datetime.now(timezone.utc)
         work_end = now.replace(hour=18, minute=0, second=0, microsecond=0)
 
         sorted_events = sorted(
@@ -188,10 +438,75 @@ def get_calendar_context(user_id: str) -> Optional[Dict[str, Any]]:
             "recommended_task_duration": min(next_free_block_minutes, 60),  # Cap at 60 mins
         }
     except Exception as e:
-        logger.warning(f"Failed to fetch calendar context (non-blocking): {e}")
+        logger.warning("Failed to fetch calendar context (non-blocking): %s", e)
         return None
 
 
+def _refresh_user_profile(user_id: str) -> None:
+    """Re-run the profile analysis so its saved ai_learning_data row stays current."""
+    try:
+        analyze_user_profile(
+            user_id,
+            UserProfileAnalyzeRequest(include_tasks=True, include_sessions=True, include_patterns=True),
+        )
+    except Exception as e:
+        logger.warning("Could not refresh user profile: %s", e)
+
+
+def _fetch_today_checkin(user_id: str, today_iso: str) -> Optional[Dict[str, Any]]:
+    """Today's daily_check_ins row (service-role client), or None."""
+    try:
+        from core.supabase import get_supabase_admin
+        supabase = get_supabase_admin()
+        result = supabase.table("daily_check_ins").select("*").eq("user_id", user_id).eq("date", today_iso).execute()
+        if result.data:
+            return result.data[0]
+    except Exception as e:
+        logger.warning("Could not fetch check-in from daily_check_ins: %s", e)
+    return None
+
+
+def _graph_node(handler: str) -> Callable[..., Any]:
+    """Graph node that calls `handler` on the orchestrator bound in the run config."""
+    def node(state: GraphState, config: "RunnableConfig") -> Any:
+        return getattr(config["configurable"]["orchestrator"], handler)(state)
+    node.__name__ = handler
+    return node
+
+
+@lru_cache(maxsize=1)
+def _compiled_graph() -> "StateGraph":
+    """Build and compile the LangGraph workflow once per process.
+
+    Nodes resolve the orchestrator from the run config, so every instance
+    shares this graph through RaimonOrchestrator.graph.
+    """
+    # Deferred: langgraph is the slowest import here and the fast path never uses it.
+    from langgraph.graph import StateGraph
+
+    workflow = StateGraph(GraphState)
+
+    # Add nodes
+    # start routes itself via Command, so it needs no conditional edges.
+    workflow.add_node("start", _graph_node("_start"), destinations=tuple(_ROUTE_NODES.values()))
+    workflow.add_node("handle_app_open", _graph_node("_handle_app_open"))
+    workflow.add_node("handle_checkin", _graph_node("_handle_checkin"))
+    workflow.add_node("handle_do_next", _graph_node("_handle_do_next"))
+    workflow.add_node("handle_do_action", _graph_node("_handle_do_action"))
+    workflow.add_node("handle_day_end", _graph_node("_handle_day_end"))
+    workflow.add_node("return_result", _graph_node("_return_result"))
+
+    # Add success paths
+    workflow.add_edge("handle_app_open", "return_result")
+    workflow.add_edge("handle_checkin", "return_result")
+    workflow.add_edge("handle_do_next", "return_result")
+    workflow.add_edge("handle_do_action", "return_result")
+    workflow.add_edge("handle_day_end", "return_result")
+
+    workflow.set_entry_point("start")
+    return workflow.compile()
+
+
 class RaimonOrchestrator:
     """Main orchestration engine for the Raimon agent system."""
 
@@ -199,63 +514,248 @@ class RaimonOrchestrator:
         from agent_mvp import storage
         self.storage = storage
         self.agents = {}  # Will be populated by dependency injection
-        self.graph = self._build_graph()
-
-    def _build_graph(self) -> StateGraph:
-        """Build the LangGraph workflow."""
-        workflow = StateGraph(GraphState)
-
-        # Add nodes
-        workflow.add_node("start", self._start)
-        workflow.add_node("handle_app_open", self._handle_app_open)
-        workflow.add_node("handle_checkin", self._handle_checkin)
-        workflow.add_node("handle_do_next", self._handle_do_next)
-        workflow.add_node("handle_do_action", self._handle_do_action)
-        workflow.add_node("handle_day_end", self._handle_day_end)
-        workflow.add_node("return_result", self._return_result)
-
-        # Add conditional edges based on event type
-        workflow.add_conditional_edges(
-            "start",
-            self._route_event,
-            {
-                "app_open": "handle_app_open",
-                "checkin_submitted": "handle_checkin",
-                "do_next": "handle_do_next",
-                "do_action": "handle_do_action",
-                "day_end": "handle_day_end",
-                "error": "return_result",
-            }
+        # Independent agent calls overlap on this pool when enabled; None keeps
+        # them sequential (and deterministic for tests).
+        self._io_pool = (
+            ThreadPoolExecutor(max_workers=4, thread_name_prefix="orchestrator-io")
+            if get_settings().agent_parallel_io
+            else None
         )
+        # Fire-and-forget storage writes go through this queue when enabled;
+        # None writes inline.
+        self._write_q: Optional[queue.Queue] = None
+        self._dropped_events = 0
+        if get_settings().agent_background_writes:
+            self._start_writer()
+        # (user_id, constraints) -> candidate rows, grouped by user; a TTL of 0 disables it.
+        self._candidate_cache = TTLCache(get_settings().agent_candidate_cache_ttl, CANDIDATE_CACHE_SIZE)
+        # (user_id, date) -> today's check-in row for do_next; a TTL of 0 disables it.
+        self._checkin_cache = TTLCache(get_settings().agent_checkin_cache_ttl, CHECKIN_CACHE_SIZE)
+        # Every known event maps 1:1 to a handler, so these bypass graph.invoke.
+        self._event_fast_path = {
+            "APP_OPEN": self._handle_app_open,
+            "CHECKIN_SUBMITTED": self._handle_checkin,
+            "DO_NEXT": self._handle_do_next,
+            "DO_ACTION": self._handle_do_action,
+            "DAY_END": self._handle_day_end,
+        }
 
-        # Add success paths
-        workflow.add_edge("handle_app_open", "return_result")
-        workflow.add_edge("handle_checkin", "return_result")
-        workflow.add_edge("handle_do_next", "return_result")
-        workflow.add_edge("handle_do_action", "return_result")
-        workflow.add_edge("handle_day_end", "return_result")
+    @property
+    def storage(self) -> Any:
+        """Storage backend; assigning a falsy value installs the null storage."""
+        return self._storage
 
-        workflow.set_entry_point("start")
-        return workflow.compile()
+    @storage.setter
+    def storage(self, storage: Any) -> None:
+        self._storage = storage or _NULL_STORAGE
+
+    @storage.deleter
+    def storage(self) -> None:
+        from agent_mvp import storage
+        self.storage = storage
+
+    @property
+    def agents(self) -> Dict[str, Any]:
+        """Injected agents; assigning a new mapping re-binds the agent hooks."""
+        return self._agents
+
+    @agents.setter
+    def agents(self, agents: Optional[Dict[str, Any]]) -> None:
+        self._agents = agents or {}
+        self._bind_agents()
+
+    @agents.deleter
+    def agents(self) -> None:
+        self.agents = {}
+
+    def _bind_agents(self) -> None:
+        """Bind each agent hook to the injected agent method or the module fallback.
+
+        Every hook has one call signature regardless of which side it resolves
+        to, so handlers pay a single attribute load per call.
+        """
+        agents = self._agents
+
+        self._log_event = agents["events"].log_event if "events" in agents else _skip_log_event
+        self._resume_context = (
+            agents["context_continuity_agent"].process
+            if "context_continuity_agent" in agents
+            else resume_context
+        )
+        self._adapt_constraints = (
+            agents["state_adapter_agent"].process
+            if "state_adapter_agent" in agents
+            else adapt_checkin_to_constraints
+        )
+        self._prioritize = (
+            agents["priority_engine_agent"].process
+            if "priority_engine_agent" in agents
+            else _no_candidates
+        )
+        self._select_task = (
+            agents["do_selector"].select_task
+            if "do_selector" in agents
+            else _no_selection
+        )
+
+        if "gamification_rules" in agents:
+            update_xp = agents["gamification_rules"].update_xp
+            self._xp_update = lambda user_id, reason, metadata=None: update_xp(user_id, reason)
+        else:
+            self._xp_update = update_gamification
+
+        self._gen_motivation = (
+            agents["motivation_agent"].generate_message
+            if "motivation_agent" in agents
+            else generate_motivation
+        )
+        self._detect_stuck = (
+            agents["stuck_pattern_agent"].process
+            if "stuck_pattern_agent" in agents
+            else detect_stuck_patterns
+        )
+
+        if "project_insight_agent" in agents:
+            generate_insights = agents["project_insight_agent"].generate_insights
+            self._gen_insights = (
+                lambda user_id, request: generate_insights({"user_id": user_id, **request})
+            )
+        else:
+            self._gen_insights = generate_project_insights
+
+    def _run_independent(
+        self, *calls: Callable[[], Any], return_exceptions: bool = False
+    ) -> List[Any]:
+        """Run independent agent calls, concurrently when the I/O pool is enabled."""
+        return run_independent(self._io_pool, *calls, return_exceptions=return_exceptions)
+
+    def _start_writer(self) -> None:
+        """Start the background thread that batches storage writes."""
+        self._write_q = queue.Queue(maxsize=10_000)
+        self._writer = threading.Thread(
+            target=self._drain_writes, name="orchestrator-writer", daemon=True
+        )
+        self._writer.start()
+        atexit.register(self._flush_writes)
+
+    def _write_behind(self, method: str, *args: Any) -> None:
+        """Queue a storage write, or run it inline when the writer is off or full."""
+        if self._write_q is not None:
+            try:
+                self._write_q.put_nowait((method, args))
+                return
+            except queue.Full:
+                logger.warning("⚠️ Write queue full, writing %s inline", method)
+        getattr(self.storage, method)(*args)
+
+    def _drain_writes(self) -> None:
+        """Collect queued writes into batches and apply them until a None sentinel."""
+        while True:
+            item = self._write_q.get()
+            batch = []
+            deadline = time.monotonic() + WRITE_FLUSH_INTERVAL
+            while item is not None:
+                batch.append(item)
+                remaining = deadline - time.monotonic()
+                if len(batch) >= WRITE_BATCH_SIZE or remaining <= 0:
+                    break
+                try:
+                    item = self._write_q.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            self._apply_writes(batch)
+            if item is None:
+                return
+
+    def _apply_writes(self, batch: List[tuple]) -> None:
+        """Apply a batch of queued writes; failures are logged, not raised."""
+        agent_events = []
+        active_dos: Dict[str, Dict[str, Any]] = {}
+        for method, args in batch:
+            if method == _AGENT_EVENT_WRITE:
+                agent_events.append(args[0])
+                continue
+            if method == _ACTIVE_DO_WRITE:
+                active_dos[args[0]["user_id"]] = args[0]
+                continue
+            if method == "finalize_selection" and active_dos:
+                # It also writes active_do; earlier saves must land first.
+                self._apply_bulk("save_active_dos", list(active_dos.values()))
+                active_dos = {}
+            try:
+                getattr(self.storage, method)(*args)
+            except Exception as e:
+                logger.warning("⚠️ Background %s failed (non-blocking): %s", method, e)
+        if active_dos:
+            self._apply_bulk("save_active_dos", list(active_dos.values()))
+        if agent_events:
+            self._apply_bulk("log_agent_events", agent_events)
+
+    def _apply_bulk(self, method: str, rows: List[Dict[str, Any]]) -> None:
+        """Run one coalesced storage write; failures are logged, not raised."""
+        try:
+            getattr(self.storage, method)(rows)
+        except Exception as e:
+            logger.warning("⚠️ Background %s failed (non-blocking): %s", method, e)
+
+    def _flush_writes(self, timeout: float = 5.0) -> None:
+        """Stop the writer after it applies everything already queued."""
+        if self._write_q is None:
+            return
+        self._write_q.put(None)
+        self._writer.join(timeout)
+        self._write_q = None
+
+    def _get_task_candidates(
+        self, user_id: str, constraints: Optional[SelectionConstraints]
+    ) -> List[Dict[str, Any]]:
+        """Fetch task candidates, reusing a recent result for the same constraints."""
+        if not self._candidate_cache.ttl:
+            return get_task_candidates(user_id, constraints)
+
+        key = (
+            user_id,
+            constraints.model_dump_json() if hasattr(constraints, "model_dump_json") else repr(constraints),
+        )
+        candidates = self._candidate_cache.get(key)
+        if candidates is None:
+            candidates = get_task_candidates(user_id, constraints)
+            self._candidate_cache.set(key, candidates, group=user_id)
+        return list(candidates)
+
+    def _invalidate_task_candidates(self, user_id: str) -> None:
+        """Drop every cached candidate list for a user after their tasks change."""
+        self._candidate_cache.invalidate(user_id)
+
+    def _get_today_checkin(self, user_id: str, today_iso: str) -> Optional[Dict[str, Any]]:
+        """Today's check-in row for a user, reused within the check-in TTL once one exists."""
+        if not self._checkin_cache.ttl:
+            return _fetch_today_checkin(user_id, today_iso)
+
+        key = (user_id, today_iso)
+        checkin = self._checkin_cache.get(key)
+        if checkin is None:
+            checkin = _fetch_today_checkin(user_id, today_iso)
+            # A check-in may be written by another route or worker; keep looking until one exists.
+            if checkin is not None:
+                self._checkin_cache.set(key, checkin)
+        return checkin
+
+    @cached_property
+    def graph(self) -> "StateGraph":
+        """Shared compiled workflow bound to this orchestrator, built on first use."""
+        return _compiled_graph().with_config(configurable={"orchestrator": self})
 
     def _route_event(self, state: GraphState) -> str:
         """Route to appropriate handler based on event type."""
         event = state.current_event
-        if isinstance(event, AppOpenEvent):
-            return "app_open"
-        elif isinstance(event, CheckInSubmittedEvent):
-            return "checkin_submitted"
-        elif isinstance(event, DoNextEvent):
-            return "do_next"
-        elif isinstance(event, DoActionEvent):
-            return "do_action"
-        elif isinstance(event, DayEndEvent):
-            return "day_end"
-        else:
-            logger.error(f"Unknown event type: {type(event)}")
+        route = _EVENT_ROUTES.get(getattr(event, "event_type", None))
+        if route is None:
+            logger.error("Unknown event type: %s", type(event))
             state.success = False
             state.error = f"Unknown event type: {type(event)}"
             return "error"
+        return route
 
     def _select_and_store_active_do(
         self,
@@ -264,66 +764,67 @@ class RaimonOrchestrator:
         constraints: Optional[SelectionConstraints],
         event_context: str,
         candidate_dicts: Optional[List[Dict[str, Any]]] = None,
+        now: Optional[datetime] = None,
+        agent_event: Optional[Dict[str, Any]] = None,
     ) -> tuple[Optional[ActiveDo], Optional[CoachOutput]]:
-        """Run selection pipeline (LLM + deterministic fallback) and persist active_do."""
-        if isinstance(constraints, SelectionConstraints):
-            selection_constraints = constraints
-        elif constraints is None:
-            selection_constraints = SelectionConstraints()
-        else:
-            data = constraints.model_dump() if hasattr(constraints, "model_dump") else constraints
-            selection_constraints = SelectionConstraints(**data)
+        """Run selection pipeline (LLM + deterministic fallback) and persist active_do.
+
+        When `agent_event` is given it is written together with active_do in a
+        single finalize_selection call; it is only consumed if a task is selected.
+        """
+        selection_constraints = constraints if constraints is not None else SelectionConstraints()
 
         if candidate_dicts is None:
-            candidate_dicts = get_task_candidates(user_id, selection_constraints)
+            candidate_dicts = self._get_task_candidates(user_id, selection_constraints)
 
         if not candidate_dicts:
-            logger.warning(f"No task candidates available for user {user_id}")
+            logger.warning("No task candidates available for user %s", user_id)
             return None, None
 
-        task_models: List[TaskCandidate] = []
-        for raw in candidate_dicts:
-            try:
-                task_models.append(_to_task_candidate(raw))
-            except Exception as err:
-                logger.warning(f"Failed to coerce task candidate (non-blocking): {err}")
+        task_models = _to_task_candidates(candidate_dicts)
+        candidate_by_id: Dict[str, TaskCandidate] = {}
+        for candidate in task_models:
+            candidate_by_id.setdefault(candidate.id, candidate)
 
         if not task_models:
-            logger.warning(f"No valid task candidates after coercion for user {user_id}")
+            logger.warning("No valid task candidates after coercion for user %s", user_id)
             return None, None
 
         state.candidates = task_models
 
+        # Only the shortlist goes into the prompt; the full list stays available
+        # for the deterministic fallback and the id lookup below.
+        llm_candidates = _shortlist_candidates(task_models)
+
         selector_output = None
         selector_valid = False
         try:
             selector_output, selector_valid = llm_select_task(
-                candidates=task_models,
+                candidates=llm_candidates,
                 constraints=selection_constraints,
                 recent_actions={"context": event_context},
             )
         except Exception as err:
-            logger.warning(f"LLM DoSelector failed, will fallback: {err}")
+            logger.warning("LLM DoSelector failed, will fallback: %s", err)
 
         if not selector_output:
             try:
                 deterministic_payload = {
                     "user_id": user_id,
-                    "candidates": [candidate.model_dump() for candidate in task_models],
+                    "candidates": task_models,  # read via getattr; no per-task dump needed
                     "constraints": selection_constraints.model_dump(),
                     "recent_actions": {"context": event_context},
                 }
                 selector_output = select_optimal_task(deterministic_payload)
                 selector_valid = False
             except Exception as fallback_err:
-                logger.error(f"Deterministic selector failed: {fallback_err}")
+                logger.error("Deterministic selector failed: %s", fallback_err)
                 return None, None
 
-        selected_task = next((c for c in task_models if c.id == selector_output.task_id), None)
-        if not selected_task:
-            selected_task = task_models[0]
+        selected_task = candidate_by_id.get(selector_output.task_id) or task_models[0]
 
         reason_codes = selector_output.reason_codes or ["constraints_fit"]
+        alt_task_ids = selector_output.alt_task_ids or []
 
         coach_output: Optional[CoachOutput] = None
         coach_valid = False
@@ -334,17 +835,18 @@ class RaimonOrchestrator:
                 mode=selection_constraints.mode,
             )
         except Exception as coach_err:
-            logger.warning(f"Coach agent failed, using fallback: {coach_err}")
+            logger.warning("Coach agent failed, using fallback: %s", coach_err)
             coach_output = CoachOutput(
                 title="Let's move",
                 message=f"Start with “{selected_task.title}” and build momentum.",
                 next_step="Begin now.",
             )
 
-        selection_time = datetime.utcnow().isoformat()
+        selected_at = now or datetime.now(timezone.utc)
+        selection_time = selected_at.isoformat()
         metadata = {
             "reason_codes": reason_codes,
-            "alt_task_ids": selector_output.alt_task_ids or [],
+            "alt_task_ids": alt_task_ids,
             "selector_valid": selector_valid,
             "coach_valid": coach_valid,
             "context": event_context,
@@ -359,26 +861,57 @@ class RaimonOrchestrator:
 
         selection_reason = ",".join(reason_codes) if reason_codes else event_context
 
-        save_active_do(
+        self._write_behind(
+            "finalize_selection",
             {
                 "user_id": user_id,
                 "task": task_payload,
                 "selection_reason": selection_reason,
                 "coaching_message": coach_output.message if coach_output else None,
                 "started_at": selection_time,
-            }
+            },
+            agent_event,
         )
 
         active_do = ActiveDo(
             task=selected_task,
             reason_codes=reason_codes,
-            alt_task_ids=selector_output.alt_task_ids or [],
+            alt_task_ids=alt_task_ids,
+            selected_at=selected_at,
         )
         return active_do, coach_output
 
-    def _start(self, state: GraphState) -> GraphState:
-        """No-op start node for graph entry."""
-        return state
+    def _log_agent_event_safe(self, agent_event: Dict[str, Any]) -> None:
+        """Log an agent event on its own, never failing the handler.
+
+        With the background writer running, the event is queued for a batched
+        insert; if the queue is full it is dropped and counted rather than
+        written inline.
+        """
+        if self._write_q is not None:
+            row = {**agent_event, "timestamp": datetime.now(timezone.utc).isoformat()}
+            try:
+                self._write_q.put_nowait((_AGENT_EVENT_WRITE, (row,)))
+            except queue.Full:
+                self._dropped_events += 1
+                logger.warning("⚠️ Write queue full, dropped agent event (%s dropped)", self._dropped_events)
+            return
+        try:
+            log_agent_event(agent_event["user_id"], agent_event["event_type"], agent_event["event_data"])
+        except Exception as log_err:
+            logger.warning("⚠️ log_agent_event failed (non-blocking): %s", log_err)
+
+    def _start(self, state: GraphState) -> "Command":
+        """Graph entry: jump straight to the handler node for the event."""
+        from langgraph.types import Command
+
+        route = self._route_event(state)
+        if route == "error":
+            return Command(
+                goto=_ROUTE_NODES[route],
+                update={"success": state.success, "error": state.error},
+            )
+        return Command(goto=_ROUTE_NODES[route])
 
     @track(name="orchestrator_app_open")
     def _handle_app_open(self, state: GraphState) -> GraphState:
@@ -387,27 +920,18 @@ class RaimonOrchestrator:
             event = state.current_event
             user_id = event.user_id
 
-            # Get session state if storage is available
-            if hasattr(self, 'storage') and self.storage:
-                self.storage.get_session_state(user_id)
-            
-            # Log event if agents available
-            if hasattr(self, 'agents') and self.agents and 'events' in self.agents:
-                self.agents['events'].log_event(event)
-            
+            self._log_event(event)
+
             # Resume context via agent if available
-            if hasattr(self, 'agents') and self.agents and 'context_continuity_agent' in self.agents:
-                resumption = self.agents['context_continuity_agent'].process(event)
-            else:
-                resumption = resume_context(event)
+            resumption = self._resume_context(event)
 
             state.context_resumption = resumption
             state.success = True
 
-            logger.info(f"📱 App opened for user {user_id}")
+            logger.info("📱 App opened for user %s", user_id)
 
         except Exception as e:
-            logger.error(f"❌ App open failed: {str(e)}")
+            logger.error("❌ App open failed: %s", e)
             state.success = False
             state.error = f"Failed to resume context: {str(e)}"
 
@@ -418,23 +942,29 @@ class RaimonOrchestrator:
         """Handle check-in submission - process and prepare for task selection."""
         try:
             event = state.current_event
+            # Bind event fields once; they feed the check-in, the request and the logs.
             user_id = event.user_id
+            energy_level = event.energy_level
+            focus_areas = event.focus_areas
+            time_available = event.time_available
+            context = getattr(event, "context", None)
+            now = datetime.now(timezone.utc)
 
-            if hasattr(self, "agents") and self.agents and "events" in self.agents:
-                self.agents["events"].log_event(event)
+            self._log_event(event)
+            # A new check-in replaces whatever do_next may have cached for today.
+            self._checkin_cache.discard((user_id, now.date().isoformat()))
 
             # Create a DailyCheckIn from the event data
             # The event only has minimal fields, so we construct a DailyCheckIn with what we have
-            from datetime import datetime
             daily_checkin = DailyCheckIn(
-                date=datetime.utcnow().isoformat().split('T')[0],  # YYYY-MM-DD format
-                energy_level=event.energy_level,
+                date=now.date().isoformat(),  # YYYY-MM-DD format
+                energy_level=energy_level,
                 mood=getattr(event, "mood", None),
                 sleep_quality=getattr(event, "sleep_quality", None),
-                focus_minutes=event.time_available if event.time_available else None,
-                context=getattr(event, "context", None),
-                priorities=event.focus_areas if event.focus_areas else [],  # Map focus_areas to priorities
-                day_of_week=datetime.utcnow().weekday(),
+                focus_minutes=time_available if time_available else None,
+                context=context,
+                priorities=focus_areas if focus_areas else [],  # Map focus_areas to priorities
+                day_of_week=now.weekday(),
             )
             
             # For now, use minimal user profile (can be enhanced later)
@@ -443,63 +973,57 @@ class RaimonOrchestrator:
             # Create the constraint request with proper objects
             constraint_request = CheckInToConstraintsRequest(
                 user_id=user_id,
-                energy_level=event.energy_level,
-                focus_areas=event.focus_areas,
-                time_available=getattr(event, "time_available", None),
+                energy_level=energy_level,
+                focus_areas=focus_areas,
+                time_available=time_available,
                 check_in_data=daily_checkin,
                 user_profile=user_profile,
             )
 
-            logger.info(f"📋 Constraint request created: event_type={type(event).__name__} request_type={type(constraint_request).__name__}")
-
-            if hasattr(self, "agents") and self.agents and "state_adapter_agent" in self.agents:
-                constraints = self.agents["state_adapter_agent"].process(constraint_request)
-            else:
-                constraints = adapt_checkin_to_constraints(constraint_request)
+            logger.debug(
+                "📋 Constraint request created: event_type=%s request_type=%s",
+                type(event).__name__, type(constraint_request).__name__,
+            )
 
-            if hasattr(self, "agents") and self.agents and "priority_engine_agent" in self.agents:
-                candidates = self.agents["priority_engine_agent"].process({"constraints": constraints})
-            else:
-                candidates = []
+            constraints = self._adapt_constraints(constraint_request)
+            if isinstance(constraints, dict):
+                constraints = SelectionConstraints(**constraints)
 
-            if hasattr(self, "agents") and self.agents and "do_selector" in self.agents:
-                selection = self.agents["do_selector"].select_task({"candidates": candidates})
-            else:
-                selection = {"task": None, "reason": ""}
+            candidates = self._prioritize({"constraints": constraints})
+            selection = self._select_task({"candidates": candidates})
 
             # Ensure selection has all required fields for storage
             if isinstance(selection, dict):
-                from datetime import datetime
                 selection["user_id"] = user_id
                 if "selection_reason" not in selection:
                     selection["selection_reason"] = selection.get("reason", "No specific reason")
                 if "coaching_message" not in selection:
                     selection["coaching_message"] = "Get started with your task!"
                 if "started_at" not in selection:
-                    selection["started_at"] = datetime.utcnow()
+                    selection["started_at"] = now
             
             # Try to save to storage, but only if there's a selected task and don't fail if storage is unavailable
-            if selection.get("task") and hasattr(self, "storage") and self.storage:
+            if selection.get("task"):
                 try:
-                    self.storage.save_active_do(selection)
+                    self._write_behind(_ACTIVE_DO_WRITE, selection)
                 except Exception as storage_error:
-                    logger.warning(f"⚠️ Storage save skipped: {str(storage_error)}")
-            elif not selection.get("task"):
-                logger.warning(f"⚠️ active_do not saved: no selected task for user {user_id}")
+                    logger.warning("⚠️ Storage save skipped: %s", storage_error)
+            else:
+                logger.warning("⚠️ active_do not saved: no selected task for user %s", user_id)
 
             state.selection_constraints = constraints
             state.constraints = constraints
             state.success = True
 
-            logger.info(f"✅ Check-in processed for user {user_id}")
+            logger.info("✅ Check-in processed for user %s", user_id)
 
             # Immediately run selection so downstream UI can read recommendation
-            context_label = getattr(event, "context", "checkin")
             active_do, coach_output = self._select_and_store_active_do(
                 state,
                 user_id,
                 constraints,
-                context_label,
+                context or "checkin",
+                now=now,
             )
             if active_do:
                 state.active_do = active_do.model_dump()
@@ -507,7 +1031,7 @@ class RaimonOrchestrator:
                 state.coach_message = coach_output
 
         except Exception as e:
-            logger.error(f"❌ Check-in processing failed: {str(e)}", exc_info=True)
+            logger.error("❌ Check-in processing failed: %s", e, exc_info=True)
             state.success = False
             state.error = f"Failed to process check-in: {str(e)}"
 
@@ -516,166 +1040,107 @@ class RaimonOrchestrator:
     @track(name="orchestrator_do_next")
     def _handle_do_next(self, state: GraphState) -> GraphState:
         """Handle do_next event - execute full task selection flow."""
+        do_next_event: Optional[Dict[str, Any]] = None
+        event_persisted = False
         try:
             event = state.current_event
             user_id = event.user_id
+            now = datetime.now(timezone.utc)
+            today_iso = now.date().isoformat()
+            day_of_week = now.weekday()
 
-            try:
-                log_agent_event(user_id, "do_next", {"context": getattr(event, "context", None)})
-            except Exception as log_err:
-                logger.warning(f"⚠️ log_agent_event failed (non-blocking): {log_err}")
+            # Written with active_do via finalize_selection; the finally block
+            # logs it on its own when no task ends up being selected.
+            do_next_event = {
+                "user_id": user_id,
+                "event_type": "do_next",
+                "event_data": {"context": getattr(event, "context", None)},
+            }
 
             if getattr(event, "constraints", None):
                 state.selection_constraints = event.constraints
                 state.constraints = event.constraints
 
-            # Get user profile (handle both dict and Pydantic returns)
-            user_profile = None
-            try:
-                # Create proper UserProfileAnalyzeRequest object
-                from agent_mvp.contracts import UserProfileAnalyzeRequest
-                profile_request = UserProfileAnalyzeRequest(
-                    include_tasks=True,
-                    include_sessions=True,
-                    include_patterns=True,
-                )
-                profile_result = analyze_user_profile(user_id, profile_request)
-                # If result is a dict, convert to UserProfileAnalysis
-                if isinstance(profile_result, dict):
-                    user_profile = UserProfileAnalysis(**{k: v for k, v in profile_result.items() if k in UserProfileAnalysis.__fields__})
-                else:
-                    user_profile = profile_result
-            except Exception as e:
-                logger.warning(f"Could not fetch user profile: {str(e)}")
-                user_profile = UserProfileAnalysis()
+            # The profile refresh, calendar context and today's check-in are
+            # independent; the check-in is only needed when the event carries
+            # no constraints. do_next only needs the profile analysis's save.
+            needs_checkin = not state.selection_constraints
+            _, calendar_context, latest_checkin = self._run_independent(
+                lambda: _refresh_user_profile(user_id),
+                lambda: get_calendar_context(user_id, now),
+                lambda: self._get_today_checkin(user_id, today_iso) if needs_checkin else None,
+            )
 
-            # Fetch calendar context for AI-aware task selection
-            calendar_context = get_calendar_context(user_id)
             if calendar_context:
                 state.calendar_context = calendar_context
-                logger.info(f"📅 Calendar context loaded: {calendar_context.get('meetings_count', 0)} meetings, "
-                           f"{calendar_context.get('next_free_block_minutes', 120)} mins free next")
+                logger.info(
+                    "📅 Calendar context loaded: %s meetings, %s mins free next",
+                    calendar_context.get('meetings_count', 0),
+                    calendar_context.get('next_free_block_minutes', 120),
+                )
 
             # Get selection constraints if not already available
-            if not state.selection_constraints:
-                # Get latest check-in from daily_check_ins table using service-role client
-                latest_checkin = None
-                try:
-                    from core.supabase import get_supabase_admin
-                    from datetime import date
-                    supabase = get_supabase_admin()
-                    result = supabase.table("daily_check_ins").select("*").eq("user_id", user_id).eq("date", date.today().isoformat()).execute()
-                    if result.data:
-                        latest_checkin = result.data[0]
-                except Exception as e:
-                    logger.warning(f"Could not fetch check-in from daily_check_ins: {str(e)}")
-                
+            if needs_checkin:
                 if latest_checkin:
-                    # Convert dict to CheckInToConstraintsRequest object
-                    checkin_obj = DailyCheckIn(
-                        date=latest_checkin.get('date', datetime.utcnow().isoformat().split('T')[0]),
-                        energy_level=latest_checkin.get('energy_level', 5),
-                        mood=latest_checkin.get('mood'),
-                        sleep_quality=latest_checkin.get('sleep_quality'),
-                        focus_minutes=None,
-                        context=None,
-                        priorities=latest_checkin.get('focus_areas', []),
-                        day_of_week=datetime.utcnow().weekday(),
-                    )
-                    
-                    constraints_request = CheckInToConstraintsRequest(
-                        user_id=user_id,
-                        energy_level=checkin_obj.energy_level,
-                        focus_areas=checkin_obj.priorities if hasattr(checkin_obj, 'priorities') else [],
-                        check_in_data=checkin_obj,
-                        user_profile=state.user_profile or user_profile or UserProfileAnalysis(),
+                    state.selection_constraints = _build_constraints_from_checkin(
+                        user_id, latest_checkin, today_iso, day_of_week
                     )
-                    state.selection_constraints = adapt_checkin_to_constraints(constraints_request)
                     if not state.constraints:
                         state.constraints = state.selection_constraints
-                    logger.info(f"📋 Using check-in constraints: energy={checkin_obj.energy_level}")
+                    logger.info("📋 Using check-in constraints: energy=%s", state.selection_constraints.current_energy)
                 else:
                     # No check-in yet - use default balanced constraints
-                    logger.info(f"📋 No check-in found, using default constraints")
+                    logger.info("📋 No check-in found, using default constraints")
                     # Use calendar context to set max_minutes if available
                     default_max_minutes = 120
                     if calendar_context and calendar_context.get("recommended_task_duration"):
                         default_max_minutes = calendar_context["recommended_task_duration"]
-                        logger.info(f"📅 Using calendar-aware max_minutes: {default_max_minutes}")
-
-                    state.selection_constraints = {
-                        "max_minutes": default_max_minutes,
-                        "mode": "balanced",
-                        "current_energy": 5,  # Default medium energy
-                        "avoid_tags": [],
-                        "prefer_priority": None,
-                    }
+                        logger.info("📅 Using calendar-aware max_minutes: %s", default_max_minutes)
+
+                    state.selection_constraints = SelectionConstraints(
+                        max_minutes=default_max_minutes,
+                        mode="balanced",
+                        current_energy=5,  # Default medium energy
+                        avoid_tags=[],
+                        prefer_priority=None,
+                    )
                     if not state.constraints:
                         state.constraints = state.selection_constraints
-            if not state.constraints:
-                try:
-                    recent_checkins = get_user_checkins(user_id, days=1)
-                    if recent_checkins:
-                        latest_checkin = recent_checkins[0]
-                        # Ensure user_profile is a proper Pydantic model
-                        profile_for_constraints = user_profile if user_profile else UserProfileAnalysis()
-                        checkin_obj = (
-                            latest_checkin
-                            if isinstance(latest_checkin, DailyCheckIn)
-                            else DailyCheckIn(
-                                date=latest_checkin.get("date", datetime.utcnow().isoformat().split("T")[0]),
-                                energy_level=latest_checkin.get("energy_level", 5),
-                                mood=latest_checkin.get("mood"),
-                                sleep_quality=latest_checkin.get("sleep_quality"),
-                                focus_minutes=latest_checkin.get("focus_minutes"),
-                                context=latest_checkin.get("context"),
-                                priorities=latest_checkin.get("focus_areas", []),
-                                day_of_week=datetime.utcnow().weekday(),
-                            )
-                        )
-                        constraints_request = CheckInToConstraintsRequest(
-                            user_id=user_id,
-                            energy_level=checkin_obj.energy_level,
-                            focus_areas=getattr(checkin_obj, "priorities", []),
-                            check_in_data=checkin_obj,
-                            user_profile=profile_for_constraints,
-                        )
-                        state.constraints = adapt_checkin_to_constraints(constraints_request)
-                except Exception as e:
-                    logger.warning(f"Could not fetch recent check-ins: {str(e)}")
 
             if state.constraints:
                 context_label = getattr(event, "context", "do_next")
-                candidates = get_task_candidates(user_id, state.constraints)
+                candidates = self._get_task_candidates(user_id, state.constraints)
                 active_do, coach_output = self._select_and_store_active_do(
                     state,
                     user_id,
                     state.constraints,
                     context_label,
                     candidate_dicts=candidates,
+                    now=now,
+                    agent_event=do_next_event,
                 )
+                event_persisted = active_do is not None
                 if active_do:
                     state.active_do = active_do.model_dump()
+                    if coach_output:
+                        state.coach_message = coach_output
+                    state.success = True
+                    logger.info("✅ Do next processed for user %s", user_id)
                 else:
                     state.success = False
                     state.error = "No task candidates available"
-                    return state
-                if coach_output:
-                    state.coach_message = coach_output
             else:
                 state.success = False
                 state.error = "No selection constraints available"
-                return state
-
-            state.success = True
-            logger.info(f"✅ Do next processed for user {user_id}")
 
         except Exception as e:
-            logger.error(f"❌ Do next processing failed: {str(e)}", exc_info=True)
+            logger.error("❌ Do next processing failed: %s", e, exc_info=True)
             state.success = False
             state.error = f"Failed to process do_next: {str(e)}"
 
-        return state
+        finally:
+            if do_next_event and not event_persisted:
+                self._log_agent_event_safe(do_next_event)
 
         return state
 
@@ -686,40 +1151,27 @@ class RaimonOrchestrator:
             event = state.current_event
             user_id = event.user_id
             action = event.action
+            task_id = event.task_id
 
-            if hasattr(self, "agents") and self.agents and "events" in self.agents:
-                self.agents["events"].log_event(event)
+            self._log_event(event)
 
-            if hasattr(self, "storage") and self.storage:
-                self.storage.get_active_do(user_id)
+            if action in ("start", "complete"):
+                self._invalidate_task_candidates(user_id)
 
             if action == "start":
                 # Task started - update session
-                if hasattr(self, "storage") and self.storage:
-                    self.storage.update_session_status(event.task_id, "started")
-                else:
-                    update_session_status(event.task_id, "started")
+                self._write_behind("update_session_status", task_id, "started")
 
             elif action == "complete":
-                # Task completed - update gamification
-                if hasattr(self, "agents") and self.agents and "gamification_rules" in self.agents:
-                    self.agents["gamification_rules"].update_xp(user_id, "task_completed")
-                else:
-                    update_gamification(user_id, "task_completed", {"task_id": event.task_id})
-
-                # Generate motivation
-                if hasattr(self, "agents") and self.agents and "motivation_agent" in self.agents:
-                    motivation = self.agents["motivation_agent"].generate_message({
-                        "user_id": user_id,
-                        "context": "task_completion",
-                        "tone": "celebratory",
-                    })
-                else:
-                    motivation = generate_motivation({
-                        "user_id": user_id,
-                        "context": "task_completion",
-                        "tone": "celebratory",
-                    })
+                # Task completed - update gamification and generate motivation
+                motivation_request = _MOTIVATION_TASK_COMPLETE.copy()
+                motivation_request["user_id"] = user_id
+                _, motivation = self._run_independent(
+                    lambda: self._xp_update(
+                        user_id, "task_completed", {"task_id": task_id}
+                    ),
+                    lambda: self._gen_motivation(motivation_request),
+                )
 
                 state.motivation_message = motivation
 
@@ -730,20 +1182,17 @@ class RaimonOrchestrator:
                     "current_session": event.current_session,
                     "time_stuck": event.time_stuck,
                 }
-                if hasattr(self, "agents") and self.agents and "stuck_pattern_agent" in self.agents:
-                    stuck_analysis = self.agents["stuck_pattern_agent"].process(stuck_request)
-                else:
-                    stuck_analysis = detect_stuck_patterns(stuck_request)
+                stuck_analysis = self._detect_stuck(stuck_request)
 
                 if stuck_analysis.is_stuck:
                     state.stuck_analysis = stuck_analysis
                     state.microtasks = stuck_analysis.microtasks
 
             state.success = True
-            logger.info(f"⚡ Action '{action}' processed for user {user_id}")
+            logger.info("⚡ Action '%s' processed for user %s", action, user_id)
 
         except Exception as e:
-            logger.error(f"❌ Action processing failed: {str(e)}")
+            logger.error("❌ Action processing failed: %s", e)
             state.success = False
             state.error = f"Failed to process action: {str(e)}"
 
@@ -756,60 +1205,44 @@ class RaimonOrchestrator:
             event = state.current_event
             user_id = event.user_id
 
-            if hasattr(self, "agents") and self.agents and "events" in self.agents:
-                self.agents["events"].log_event(event)
-
-            # Update day completion gamification
-            if hasattr(self, "agents") and self.agents and "gamification_rules" in self.agents:
-                self.agents["gamification_rules"].update_xp(user_id, "day_completed")
-            else:
-                update_gamification(user_id, "day_completed", {"date": event.timestamp})
-
-            # Generate project insights
-            if hasattr(self, "agents") and self.agents and "project_insight_agent" in self.agents:
-                project_insights = self.agents["project_insight_agent"].generate_insights({
-                    "user_id": user_id,
-                    "insight_type": "progress",
-                    "time_range": "week",
-                })
-            else:
-                project_insights = generate_project_insights(user_id, {
-                    "insight_type": "progress",
-                    "time_range": "week",
-                })
+            self._log_event(event)
+
+            # Gamification, insights and motivation are independent; a failed
+            # one is logged and left out rather than failing the whole day end.
+            motivation_request = _MOTIVATION_DAY_END.copy()
+            motivation_request["user_id"] = user_id
+            xp_result, project_insights, motivation = self._run_independent(
+                lambda: self._xp_update(user_id, "day_completed", {"date": event.timestamp}),
+                lambda: self._gen_insights(user_id, _INSIGHTS_WEEKLY_PROGRESS.copy()),
+                lambda: self._gen_motivation(motivation_request),
+                return_exceptions=True,
+            )
+            if isinstance(xp_result, Exception):
+                logger.warning("⚠️ Day-end XP update failed for user %s: %s", user_id, xp_result)
+            if isinstance(motivation, Exception):
+                logger.warning("⚠️ Day-end motivation failed for user %s: %s", user_id, motivation)
+                motivation = None
 
             insights = []
-            if isinstance(project_insights, dict) and "insights" in project_insights:
+            if isinstance(project_insights, Exception):
+                logger.warning("⚠️ Day-end insights failed for user %s: %s", user_id, project_insights)
+            elif isinstance(project_insights, dict) and "insights" in project_insights:
                 insights = project_insights["insights"]
             else:
                 insights = getattr(project_insights, "insights", [])
 
-            # Generate motivation for day completion
-            if hasattr(self, "agents") and self.agents and "motivation_agent" in self.agents:
-                motivation = self.agents["motivation_agent"].generate_message({
-                    "user_id": user_id,
-                    "context": "day_completion",
-                    "tone": "reflective",
-                })
-            else:
-                motivation = generate_motivation({
-                    "user_id": user_id,
-                    "context": "day_completion",
-                    "tone": "reflective",
-                })
-
             # Save session insights
-            if hasattr(self, "storage") and self.storage:
-                self.storage.save_insights(user_id, insights)
+            if not isinstance(project_insights, Exception):
+                self._write_behind("save_insights", user_id, insights)
 
             state.day_insights = insights
             state.motivation_message = motivation
             state.success = True
 
-            logger.info(f"🌅 Day end processed for user {user_id}")
+            logger.info("🌅 Day end processed for user %s", user_id)
 
         except Exception as e:
-            logger.error(f"❌ Day end processing failed: {str(e)}")
+            logger.error("❌ Day end processing failed: %s", e)
             state.success = False
             state.error = f"Failed to process day end: {str(e)}"
 
@@ -830,12 +1263,11 @@ class RaimonOrchestrator:
         Returns:
             Agent response
         """
-        logger.info(f"🎭 Processing event: {type(event).__name__} (type={type(event).__name__})")
+        logger.info("🎭 Processing event: %s", type(event).__name__)
 
         # Validate explicit event_type if present
         if hasattr(event, "event_type"):
-            valid_event_types = {"APP_OPEN", "CHECKIN_SUBMITTED", "DO_NEXT", "DO_ACTION", "DAY_END"}
-            if event.event_type not in valid_event_types:
+            if event.event_type not in _VALID_EVENT_TYPES:
                 raise ValueError("Unknown event type")
 
         # Extract user_id from event
@@ -847,18 +1279,22 @@ class RaimonOrchestrator:
         event_type = self._get_event_type(event)
 
         # Initialize state
-        initial_state = GraphState(user_id=user_id, current_event=event)
+        initial_state = GraphState(user_id=user_id, current_event=event, event_type_str=event_type)
 
         try:
-            # Execute graph
-            final_state_result = self.graph.invoke(initial_state)
-            
-            # LangGraph can return either a dict or the actual state object
-            # Convert dict to GraphState if needed
-            if isinstance(final_state_result, dict):
-                final_state = GraphState(**final_state_result)
+            if self._needs_routing(event):
+                # Execute graph
+                final_state_result = self.graph.invoke(initial_state)
+
+                # LangGraph can return either a dict or the actual state object.
+                # model_validate beats model_construct here: construct runs a
+                # Python-level field loop, validation runs in pydantic-core.
+                if isinstance(final_state_result, GraphState):
+                    final_state = final_state_result
+                else:
+                    final_state = GraphState.model_validate(final_state_result)
             else:
-                final_state = final_state_result
+                final_state = self._event_fast_path[event_type](initial_state)
 
             # Build response
             response = AgentMVPResponse(
@@ -869,114 +1305,71 @@ class RaimonOrchestrator:
             if not final_state.success and final_state.error:
                 response.error = final_state.error
 
-            logger.info(f"✅ Event processed successfully: success={final_state.success} response_type={type(response).__name__}")
-            response_dict = response.model_dump()
-            
-            # Flatten event_type to root level for backward compatibility
-            if "data" in response_dict and "event_type" in response_dict["data"]:
-                response_dict["event_type"] = response_dict["data"]["event_type"]
-            
-            logger.debug(f"📊 Response dict keys: {list(response_dict.keys())}")
-            return response_dict
+            logger.info(
+                "✅ Event processed successfully: success=%s response_type=%s",
+                final_state.success, type(response).__name__,
+            )
+            response_dict = _RESPONSE_ADAPTER.dump_python(response, exclude_none=True)
 
         except Exception as e:
-            logger.error(f"❌ Orchestration failed: {str(e)}", exc_info=True)
+            logger.error("❌ Orchestration failed: %s", e, exc_info=True)
             response_data = {"event_type": event_type} if event_type else {}
-            response_dict = AgentMVPResponse(
-                success=False,
-                data=response_data,
-                error=f"Orchestration failed: {str(e)}",
-            ).model_dump()
-            
-            # Flatten event_type to root level even on error
-            if event_type:
-                response_dict["event_type"] = event_type
-            
-            return response_dict
+            # Built literally; mirrors the AgentMVPResponse dump shape.
+            response_dict = {
+                "success": False,
+                "data": response_data,
+                "error": f"Orchestration failed: {str(e)}",
+            }
+
+        # Flatten event_type to root level for backward compatibility
+        response_dict["event_type"] = event_type
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📊 Response dict keys: %s", list(response_dict.keys()))
+        return response_dict
+
+    def _needs_routing(self, event: Any) -> bool:
+        """Only events outside the known classes need the graph's isinstance routing."""
+        return type(event) not in _EVENT_TYPE_BY_CLASS
 
     def _get_event_type(self, event: Any) -> Optional[str]:
-        """Extract event type from event object."""
-        if hasattr(event, 'event_type'):
-            return event.event_type
-        
-        class_name = event.__class__.__name__
-        event_type_map = {
-            'AppOpenEvent': 'APP_OPEN',
-            'CheckInSubmittedEvent': 'CHECKIN_SUBMITTED',
-            'DoNextEvent': 'DO_NEXT',
-            'DoActionEvent': 'DO_ACTION',
-            'DayEndEvent': 'DAY_END',
-        }
-        return event_type_map.get(class_name)
+        """Extract event type from the event's tag."""
+        return getattr(event, "event_type", None)
 
     def _extract_response_data(self, state: GraphState) -> Dict[str, Any]:
         """Extract response data from final state."""
         response_data = {}
 
-        # Extract event_type from state
-        if hasattr(state, 'current_event') and state.current_event:
-            event_type = self._get_event_type(state.current_event)
-            if event_type:
-                response_data["event_type"] = event_type
-
-        # Extract context resumption (APP_OPEN)
-        if state.context_resumption:
-            response_data["context_resumption"] = state.context_resumption
-
-        # Extract selection constraints (CHECKIN_SUBMITTED)
-        if state.selection_constraints:
-            response_data["selection_constraints"] = state.selection_constraints
-
-        # Extract user profile
-        if state.user_profile:
-            response_data["user_profile"] = state.user_profile
-
-        # Extract active do (DO_NEXT)
-        if state.active_do:
-            response_data["active_do"] = state.active_do
-
-        # Extract coach message
-        if state.coach_message:
-            response_data["coach_message"] = (
-                state.coach_message.model_dump()
-                if hasattr(state.coach_message, 'model_dump')
-                else state.coach_message
-            )
+        # Event type was resolved once in process_event
+        if state.event_type_str:
+            response_data["event_type"] = state.event_type_str
 
-        # Extract motivation message (DO_ACTION:complete, DAY_END)
-        if state.motivation_message:
-            response_data["motivation_message"] = (
-                state.motivation_message.model_dump()
-                if hasattr(state.motivation_message, 'model_dump')
-                else state.motivation_message
-            )
-
-        # Extract stuck analysis and microtasks (DO_ACTION:stuck)
-        if state.stuck_analysis:
-            response_data["stuck_analysis"] = (
-                state.stuck_analysis.model_dump()
-                if hasattr(state.stuck_analysis, 'model_dump')
-                else state.stuck_analysis
-            )
+        for attr, key, serialize in _RESPONSE_FIELDS:
+            value = getattr(state, attr)
+            if not value:
+                continue
+            if attr == "microtasks" and value is getattr(state.stuck_analysis, "microtasks", None):
+                # The stuck analysis dump above already serialized this list.
+                response_data[key] = response_data["stuck_analysis"]["microtasks"]
+                continue
+            response_data[key] = serialize(value)
 
-        if state.microtasks:
-            response_data["microtasks"] = [
-                (m.model_dump() if hasattr(m, 'model_dump') else m)
-                for m in state.microtasks
-            ]
+        return response_data
 
-        # Extract day insights (DAY_END)
-        if state.day_insights:
-            response_data["day_insights"] = [
-                (i.model_dump() if hasattr(i, 'model_dump') else i)
-                for i in state.day_insights
-            ]
 
-        return response_data
+# Global orchestrator instance, built on first use so importers don't pay for the graph
+_orchestrator: Optional[RaimonOrchestrator] = None
+_orchestrator_lock = threading.Lock()
 
 
-# Global orchestrator instance
-orchestrator = RaimonOrchestrator()
+def _get_orchestrator() -> RaimonOrchestrator:
+    """Return the shared orchestrator, constructing it once on first call."""
+    global _orchestrator
+    if _orchestrator is None:
+        with _orchestrator_lock:
+            if _orchestrator is None:
+                _orchestrator = RaimonOrchestrator()
+    return _orchestrator
 
 
 def process_agent_event(event: Any) -> AgentMVPResponse:
@@ -989,4 +1382,20 @@ def process_agent_event(event: Any) -> AgentMVPResponse:
     Returns:
         Agent response
     """
-    return orchestrator.process_event(event)
+    return _get_orchestrator().process_event(event)
+
+
+def invalidate_task_candidates(user_id: str) -> None:
+    """Forget a user's cached task candidates after their tasks are edited outside the agent."""
+    if _orchestrator is not None:
+        _orchestrator._invalidate_task_candidates(user_id)
+
+
+async def aprocess_agent_event(event: Any) -> AgentMVPResponse:
+    """
+    Process an agent event without blocking the event loop.
+
+    The graph, LLM and Supabase calls are synchronous, so the work runs on a
+    worker thread and concurrent requests no longer serialize behind it.
+    """
+    return await asyncio.to_thread(process_agent_event, event)
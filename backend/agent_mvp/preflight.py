@@ -12,8 +12,9 @@ Run from backend/: python agent_mvp/preflight.py
 
 import sys
 import os
-import py_compile
+import hashlib
 from pathlib import Path
+from typing import Dict, Optional
 import logging
 
 # Add backend directory to path so agent_mvp can be imported
@@ -30,70 +31,131 @@ logger = logging.getLogger(__name__)
 
 AGENT_MVP_DIR = SCRIPT_DIR
 
+# One empty marker file per source hash that compiled cleanly, per interpreter version.
+SYNTAX_CACHE_DIR = AGENT_MVP_DIR / "__pycache__" / "preflight_ok" / sys.implementation.cache_tag
+
+# The orchestrator comes first: it imports most of the others, which then
+# resolve from sys.modules.
+IMPORT_CHECK_MODULES = (
+    "agent_mvp.orchestrator",
+    "agent_mvp.contracts",
+    "agent_mvp.validators",
+    "agent_mvp.prompts",
+    "agent_mvp.gamification_rules",
+    "agent_mvp.do_selector",
+    "agent_mvp.storage",
+    "agent_mvp.events",
+)
+
+REQUIRED_ENV_VARS = (
+    "GOOGLE_API_KEY",
+    "SUPABASE_URL",
+    "SUPABASE_KEY",
+)
+
+OPTIONAL_ENV_VARS = (
+    "OPIK_API_KEY",
+    "OPIK_BASE_URL",
+    "OPIK_PROJECT_NAME",
+)
+
 
 def check_imports() -> bool:
     """Check if key modules can be imported."""
     logger.info("🔍 Checking imports...")
     
-    modules_to_check = [
-        "agent_mvp.orchestrator",
-        "agent_mvp.contracts",
-        "agent_mvp.validators",
-        "agent_mvp.prompts",
-        "agent_mvp.gamification_rules",
-        "agent_mvp.do_selector",
-        "agent_mvp.storage",
-        "agent_mvp.events",
-    ]
-    
     all_ok = True
     missing_deps = set()
     
-    for module_name in modules_to_check:
+    for module_name in IMPORT_CHECK_MODULES:
+        if module_name in sys.modules:
+            # Already loaded by an earlier module's import chain
+            logger.info("  ✅ %s", module_name)
+            continue
         try:
             __import__(module_name)
-            logger.info(f"  ✅ {module_name}")
+            logger.info("  ✅ %s", module_name)
         except ModuleNotFoundError as e:
             # Check if it's a missing dependency or the module itself
             missing_module = str(e).split("'")[1] if "'" in str(e) else str(e)
             if missing_module != module_name:
                 # It's a missing dependency, not our module
                 missing_deps.add(missing_module)
-                logger.warning(f"  ⚠️  {module_name} (missing dep: {missing_module})")
+                logger.warning("  ⚠️  %s (missing dep: %s)", module_name, missing_module)
             else:
-                logger.error(f"  ❌ {module_name}: Module not found")
+                logger.error("  ❌ %s: Module not found", module_name)
                 all_ok = False
         except Exception as e:
-            logger.error(f"  ❌ {module_name}: {str(e)}")
+            logger.error("  ❌ %s: %s", module_name, e)
             all_ok = False
     
     if missing_deps:
-        logger.info(f"\n  Missing dependencies: {', '.join(sorted(missing_deps))}")
-        logger.info(f"  Install with: pip install {' '.join(sorted(missing_deps))}")
+        logger.info("\n  Missing dependencies: %s", ', '.join(sorted(missing_deps)))
+        logger.info("  Install with: pip install %s", ' '.join(sorted(missing_deps)))
         return False
     
     return all_ok
 
 
+def _syntax_ok_marker(src: bytes) -> Path:
+    """Marker path recording that this exact source compiled cleanly."""
+    return SYNTAX_CACHE_DIR / hashlib.blake2b(src, digest_size=16).hexdigest()
+
+
+def _compile_one(src: bytes, filename: str) -> Optional[str]:
+    """Compile one source; return the error message, or None if it is valid."""
+    try:
+        # compile() checks syntax without writing a .pyc like py_compile does
+        compile(src, filename, "exec")
+    except SyntaxError as e:
+        return str(e)
+    except Exception as e:
+        return f"Unexpected error: {e}"
+    return None
+
+
 def check_syntax() -> bool:
-    """Check syntax of all agent_mvp/*.py files using py_compile."""
+    """Check syntax of all agent_mvp/*.py files, skipping sources already seen to compile."""
     logger.info("🔍 Checking Python syntax...")
-    
-    py_files = list(AGENT_MVP_DIR.glob("*.py"))
-    
-    all_ok = True
-    for py_file in sorted(py_files):
-        if py_file.name.startswith("__"):
-            continue  # Skip __pycache__, __init__, etc.
-        
+
+    errors: Dict[str, Optional[str]] = {}
+    pending = []
+    with os.scandir(AGENT_MVP_DIR) as entries:
+        py_files = [
+            entry for entry in entries
+            # Skip __pycache__, __init__, etc.
+            if entry.name.endswith(".py") and not entry.name.startswith("__") and entry.is_file()
+        ]
+
+    for py_file in py_files:
         try:
-            py_compile.compile(str(py_file), doraise=True)
-            logger.info(f"  ✅ {py_file.name}")
-        except py_compile.PyCompileError as e:
-            logger.error(f"  ❌ {py_file.name}: {str(e)}")
-            all_ok = False
-        except Exception as e:
-            logger.error(f"  ❌ {py_file.name}: Unexpected error: {str(e)}")
+            with open(py_file.path, "rb") as f:
+                src = f.read()
+        except OSError as e:
+            errors[py_file.name] = f"Unexpected error: {e}"
+            continue
+        marker = _syntax_ok_marker(src)
+        if marker.exists():
+            errors[py_file.name] = None
+        else:
+            pending.append((py_file, src, marker))
+
+    for py_file, src, marker in pending:
+        error = _compile_one(src, py_file.path)
+        errors[py_file.name] = error
+        if error is None:
+            try:
+                marker.parent.mkdir(parents=True, exist_ok=True)
+                marker.touch()
+            except OSError:
+                pass  # Read-only tree: just recompile next run
+
+    all_ok = True
+    for name in sorted(errors):
+        if errors[name] is None:
+            logger.info("  ✅ %s", name)
+        else:
+            logger.error("  ❌ %s: %s", name, errors[name])
             all_ok = False
     
     return all_ok
@@ -102,33 +164,22 @@ def check_syntax() -> bool:
 def check_env_vars() -> bool:
     """Check optional environment variables (warnings only, doesn't fail)."""
     logger.info("🔍 Checking environment variables...")
-    
-    required_vars = [
-        "GOOGLE_API_KEY",
-        "SUPABASE_URL",
-        "SUPABASE_KEY",
-    ]
-    
-    optional_vars = [
-        "OPIK_API_KEY",
-        "OPIK_BASE_URL",
-        "OPIK_PROJECT_NAME",
-    ]
-    
+
+    env = os.environ
     all_present = True
     
-    for var in required_vars:
-        if os.getenv(var):
-            logger.info(f"  ✅ {var}")
+    for var in REQUIRED_ENV_VARS:
+        if env.get(var):
+            logger.info("  ✅ %s", var)
         else:
-            logger.warning(f"  ⚠️  {var} not set (required for LLM/DB operations)")
+            logger.warning("  ⚠️  %s not set (required for LLM/DB operations)", var)
             all_present = False
     
-    for var in optional_vars:
-        if os.getenv(var):
-            logger.info(f"  ✅ {var}")
+    for var in OPTIONAL_ENV_VARS:
+        if env.get(var):
+            logger.info("  ✅ %s", var)
         else:
-            logger.warning(f"  ⚠️  {var} not set (optional, tracing will be limited)")
+            logger.warning("  ⚠️  %s not set (optional, tracing will be limited)", var)
     
     return all_present
 
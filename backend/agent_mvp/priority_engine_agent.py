@@ -46,7 +46,7 @@ def score_task_priorities(
     Returns:
         Scored candidates with priority scores
     """
-    logger.info(f"🎯 Scoring {len(request.candidates)} task candidates")
+    logger.info("🎯 Scoring %s task candidates", len(request.candidates))
 
     scored = []
 
@@ -61,7 +61,7 @@ def score_task_priorities(
     # Sort by score descending
     scored.sort(key=lambda x: x.priority_score, reverse=True)
 
-    logger.info(f"✅ Priority scoring complete, top score: {scored[0].priority_score if scored else 0}")
+    logger.info("✅ Priority scoring complete, top score: %s", scored[0].priority_score if scored else 0)
     return PriorityScoredCandidates(scored_candidates=scored)
 
 
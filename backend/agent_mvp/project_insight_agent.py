@@ -18,15 +18,19 @@ Critical guarantees:
 - bounded output (max 5 insights, each <200 chars)
 """
 
-from typing import List, Dict, Any
-from datetime import datetime, timedelta
+from bisect import bisect_left
+from collections import Counter
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple
+import os
+from datetime import datetime, timedelta, timezone
 from agent_mvp.contracts import (
     ProjectInsightRequest,
     ProjectInsights,
     Insight,
 )
-from agent_mvp.storage import get_project_data, get_project_tasks, get_project_sessions, get_project_checkins, save_ai_learning
-from agent_mvp.gemini_client import GeminiClient
+from agent_mvp.storage import get_project_bundle, save_ai_learning
+from agent_mvp.gemini_client import get_gemini_client
 from opik import track
 import logging
 
@@ -48,17 +52,13 @@ def generate_project_insights(
     Returns:
         Project insights
     """
-    logger.info(f"💡 Generating insights for project {request.project_id}")
+    logger.info("💡 Generating insights for project %s", request.project_id)
 
     # Gather project data
-    project = get_project_data(request.project_id, user_id)
+    project, tasks, sessions, checkins = get_project_bundle(request.project_id, user_id, checkin_days=30)
     if not project:
         raise ValueError(f"Project {request.project_id} not found")
 
-    tasks = get_project_tasks(request.project_id)
-    sessions = get_project_sessions(request.project_id)
-    checkins = get_project_checkins(request.project_id, days=30)
-
     # Generate insights based on type
     if request.insight_type == "progress":
         insights = _generate_progress_insights(project, tasks, sessions)
@@ -74,13 +74,13 @@ def generate_project_insights(
 
     result = ProjectInsights(
         insights=refined_insights,
-        generated_at=datetime.utcnow(),
+        generated_at=datetime.now(timezone.utc),
     )
 
     # Save insights for learning
     _save_project_insights(user_id, request.project_id, result)
 
-    logger.info(f"✅ Generated {len(result.insights)} insights for project {request.project_id}")
+    logger.info("✅ Generated %s insights for project %s", len(result.insights), request.project_id)
     return result
 
 
@@ -95,8 +95,13 @@ def _generate_progress_insights(
     if not tasks:
         return [Insight(content="No tasks found for this project", category="progress", confidence=1.0)]
 
-    # Completion rate
-    completed = sum(1 for t in tasks if t.get("status") == "completed")
+    # Completion count and estimated time in one pass over the tasks
+    completed = 0
+    total_estimated = 0
+    for t in tasks:
+        if t.get("status") == "completed":
+            completed += 1
+        total_estimated += t.get("estimated_duration", 0)
     total = len(tasks)
     completion_rate = completed / total if total > 0 else 0
 
@@ -114,7 +119,6 @@ def _generate_progress_insights(
         ))
 
     # Time spent vs estimated
-    total_estimated = sum(t.get("estimated_duration", 0) for t in tasks)
     total_actual = sum(s.get("duration_minutes", 0) for s in sessions)
 
     if total_estimated > 0:
@@ -139,8 +143,15 @@ def _generate_productivity_insights(
     if not sessions:
         return [Insight(content="No work sessions recorded yet", category="productivity", confidence=1.0)]
 
+    # Completed count and total duration in one pass over the sessions
+    completed = 0
+    total_duration = 0
+    for s in sessions:
+        if s.get("completed_at"):
+            completed += 1
+        total_duration += s.get("duration_minutes", 0)
+
     # Session completion rate
-    completed = sum(1 for s in sessions if s.get("completed_at"))
     completion_rate = completed / len(sessions)
 
     if completion_rate < 0.5:
@@ -151,8 +162,7 @@ def _generate_productivity_insights(
         ))
 
     # Average session duration
-    durations = [s.get("duration_minutes", 0) for s in sessions]
-    avg_duration = sum(durations) / len(durations) if durations else 0
+    avg_duration = total_duration / len(sessions)
 
     if avg_duration < 25:
         insights.append(Insight(
@@ -163,9 +173,15 @@ def _generate_productivity_insights(
 
     # Energy correlation
     if checkins:
-        high_energy_sessions = [s for s in sessions if _get_session_energy(s, checkins) >= 4]
-        high_energy_completion = sum(1 for s in high_energy_sessions if s.get("completed_at"))
-        high_energy_rate = high_energy_completion / len(high_energy_sessions) if high_energy_sessions else 0
+        checkin_times, checkin_energies = _checkin_energy_index(checkins)
+        high_energy = 0
+        high_energy_completion = 0
+        for s in sessions:
+            if _get_session_energy(s, checkin_times, checkin_energies) >= 4:
+                high_energy += 1
+                if s.get("completed_at"):
+                    high_energy_completion += 1
+        high_energy_rate = high_energy_completion / high_energy if high_energy else 0
 
         if high_energy_rate > completion_rate + 0.2:
             insights.append(Insight(
@@ -185,12 +201,9 @@ def _generate_pattern_insights(
     insights = []
 
     # Task priority distribution
-    priorities = {}
-    for task in tasks:
-        pri = task.get("priority", "medium")
-        priorities[pri] = priorities.get(pri, 0) + 1
+    priorities = Counter(task.get("priority", "medium") for task in tasks)
 
-    if priorities.get("high", 0) > len(tasks) * 0.6:
+    if priorities["high"] > len(tasks) * 0.6:
         insights.append(Insight(
             content="Most tasks are high priority - consider reprioritizing",
             category="patterns",
@@ -200,7 +213,7 @@ def _generate_pattern_insights(
     # Session timing patterns
     if sessions:
         hours = [s.get("start_time", {}).get("hour", 9) for s in sessions]
-        peak_hour = max(set(hours), key=hours.count) if hours else 9
+        peak_hour = Counter(hours).most_common(1)[0][0] if hours else 9
 
         insights.append(Insight(
             content=f"Most productive around {peak_hour}:00 - schedule important work then",
@@ -223,14 +236,17 @@ def _generate_general_insights(
     created = project.get("created_at")
     if created:
         try:
-            age_days = (datetime.utcnow() - datetime.fromisoformat(created.replace('Z', '+00:00'))).days
+            created_dt = _parse_timestamp(created)
+            if created_dt.tzinfo is None:
+                created_dt = created_dt.replace(tzinfo=timezone.utc)
+            age_days = (datetime.now(timezone.utc) - created_dt).days
             if age_days > 30 and len(tasks) == 0:
                 insights.append(Insight(
                     content="Project created over a month ago but no tasks - time to break it down?",
                     category="general",
                     confidence=0.9,
                 ))
-        except:
+        except (ValueError, TypeError, AttributeError):
             pass
 
     # Session frequency
@@ -240,9 +256,9 @@ def _generate_general_insights(
             start = s.get("start_time")
             if start:
                 try:
-                    dt = datetime.fromisoformat(start.replace('Z', '+00:00'))
+                    dt = _parse_timestamp(start)
                     session_dates.add(dt.date())
-                except:
+                except (ValueError, TypeError, AttributeError):
                     pass
 
         if len(session_dates) >= 7:  # Worked at least 7 different days
@@ -263,9 +279,12 @@ def _refine_insights_with_llm(
     """Use LLM to refine and enhance insights."""
     if not base_insights:
         return []
+    if not os.getenv("GOOGLE_API_KEY"):
+        # GeminiClient can't be built without a key; skip the failing attempt
+        return base_insights[:3]
 
     try:
-        client = GeminiClient()
+        client = get_gemini_client()
 
         prompt = f"""
         Project: {project.get('name', 'Unknown')}
@@ -283,7 +302,7 @@ def _refine_insights_with_llm(
         Return as JSON array of strings.
         """
 
-        response = client.generate_json_response(prompt, max_tokens=300)
+        response = client.generate_json_response(prompt, max_tokens=300, cache=True)
 
         if isinstance(response, list) and response:
             refined = []
@@ -297,36 +316,76 @@ def _refine_insights_with_llm(
             return refined
 
     except Exception as e:
-        logger.warning(f"⚠️ LLM insight refinement failed: {str(e)}")
+        logger.warning("⚠️ LLM insight refinement failed: %s", e)
 
     # Return base insights if LLM fails
     return base_insights[:3]
 
 
-def _get_session_energy(session: Dict[str, Any], checkins: List[Dict[str, Any]]) -> int:
+def _parse_timestamp(value: Any) -> datetime:
+    """Parse a stored ISO timestamp string."""
+    if not isinstance(value, str):
+        # Only strings go through the cache; dicts and lists aren't hashable
+        raise TypeError(f"Expected an ISO timestamp string, got {type(value).__name__}")
+    return _parse_iso(value)
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO string; memoized since the same rows recur across requests."""
+    if value.endswith("Z"):
+        # fromisoformat only accepts a trailing Z from Python 3.11
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+def _checkin_energy_index(checkins: List[Dict[str, Any]]) -> Tuple[List[datetime], List[int]]:
+    """Check-in times sorted ascending, with the energy level logged at each."""
+    entries = []
+    for checkin in checkins:
+        checkin_time = checkin.get("created_at")
+        if not checkin_time:
+            continue
+        try:
+            checkin_dt = _parse_timestamp(checkin_time)
+        except (ValueError, TypeError, AttributeError):
+            continue
+        entries.append((checkin_dt, checkin.get("energy_level", 3)))
+
+    try:
+        entries.sort(key=lambda entry: entry[0])
+    except TypeError:
+        return [], []  # Mixed naive/aware timestamps can't be compared
+    return [dt for dt, _ in entries], [energy for _, energy in entries]
+
+
+def _get_session_energy(
+    session: Dict[str, Any],
+    checkin_times: List[datetime],
+    checkin_energies: List[int],
+) -> int:
     """Get energy level for a session based on nearby check-ins."""
     session_time = session.get("start_time")
-    if not session_time:
+    if not session_time or not checkin_times:
         return 3  # Default
 
     try:
-        session_dt = datetime.fromisoformat(session_time.replace('Z', '+00:00'))
+        session_dt = _parse_timestamp(session_time)
 
-        # Find closest check-in within 2 hours
+        # Closest check-in within 2 hours is one of the two neighbours of the
+        # session's insertion point.
+        pos = bisect_left(checkin_times, session_dt)
         closest_energy = 3
         min_diff = timedelta(hours=2)
-
-        for checkin in checkins:
-            checkin_time = checkin.get("created_at")
-            if checkin_time:
-                checkin_dt = datetime.fromisoformat(checkin_time.replace('Z', '+00:00'))
-                diff = abs(session_dt - checkin_dt)
+        for i in (pos - 1, pos):
+            if 0 <= i < len(checkin_times):
+                diff = abs(session_dt - checkin_times[i])
                 if diff < min_diff:
                     min_diff = diff
-                    closest_energy = checkin.get("energy_level", 3)
+                    closest_energy = checkin_energies[i]
 
         return closest_energy
-    except:
+    except (ValueError, TypeError, AttributeError):
         return 3
 
 
@@ -341,8 +400,8 @@ def _save_project_insights(user_id: str, project_id: str, insights: ProjectInsig
                 "insights": [i.model_dump() for i in insights.insights],
                 "generated_at": insights.generated_at.isoformat(),
             },
-            expires_at=datetime.utcnow() + timedelta(days=7),  # Refresh weekly
+            expires_at=datetime.now(timezone.utc) + timedelta(days=7),  # Refresh weekly
         )
-        logger.info(f"💾 Saved project insights for user {user_id}")
+        logger.info("💾 Saved project insights for user %s", user_id)
     except Exception as e:
-        logger.warning(f"⚠️ Failed to save project insights: {str(e)}")
\ No newline at end of file
+        logger.warning("⚠️ Failed to save project insights: %s", e)
\ No newline at end of file
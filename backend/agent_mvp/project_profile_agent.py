@@ -24,8 +24,9 @@ from agent_mvp.contracts import (
     ProjectProfile,
     ProjectSuggestion,
 )
-from agent_mvp.storage import get_project_data, get_project_tasks, get_project_sessions, save_ai_learning
-from agent_mvp.gemini_client import GeminiClient
+from agent_mvp.storage import get_project_bundle, save_ai_learning
+from agent_mvp.gemini_client import get_gemini_client
+from agent_mvp.prompts import build_project_suggestions_prompt
 from opik import track
 import logging
 
@@ -47,10 +48,10 @@ def analyze_project_profile(
     Returns:
         ProjectProfile with normalized data and optional suggestions
     """
-    logger.info(f"📁 Analyzing project {request.project_id} for user {user_id}")
+    logger.info("📁 Analyzing project %s for user %s", request.project_id, user_id)
 
     # Get project data
-    project = get_project_data(request.project_id, user_id)
+    project, tasks, sessions, _ = get_project_bundle(request.project_id, user_id)
     if not project:
         raise ValueError(f"Project {request.project_id} not found")
 
@@ -58,10 +59,10 @@ def analyze_project_profile(
     normalized = _normalize_project_data(project)
 
     # Add task statistics
-    normalized["task_stats"] = _analyze_project_tasks(request.project_id)
+    normalized["task_stats"] = _analyze_project_tasks(tasks)
 
     # Add session statistics
-    normalized["session_stats"] = _analyze_project_sessions(request.project_id)
+    normalized["session_stats"] = _analyze_project_sessions(sessions)
 
     profile = ProjectProfile(
         project_id=request.project_id,
@@ -72,7 +73,7 @@ def analyze_project_profile(
     if request.include_suggestions:
         profile.suggestions = _generate_project_suggestions(user_id, normalized)
 
-    logger.info(f"✅ Project profile complete for {request.project_id}")
+    logger.info("✅ Project profile complete for %s", request.project_id)
     return profile
 
 
@@ -91,21 +92,21 @@ def _normalize_project_data(project: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def _analyze_project_tasks(project_id: str) -> Dict[str, Any]:
+def _analyze_project_tasks(tasks: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Analyze tasks within the project."""
-    tasks = get_project_tasks(project_id)
 
     if not tasks:
         return {"total_tasks": 0, "completed": 0, "completion_rate": 0}
 
-    completed = sum(1 for t in tasks if t.get("status") == "completed")
-    total = len(tasks)
-
-    # Priority distribution
+    # Completion count and priority distribution in one pass over the tasks
+    completed = 0
     priorities = {}
     for task in tasks:
+        if task.get("status") == "completed":
+            completed += 1
         pri = task.get("priority", "medium")
         priorities[pri] = priorities.get(pri, 0) + 1
+    total = len(tasks)
 
     return {
         "total_tasks": total,
@@ -115,15 +116,18 @@ def _analyze_project_tasks(project_id: str) -> Dict[str, Any]:
     }
 
 
-def _analyze_project_sessions(project_id: str) -> Dict[str, Any]:
+def _analyze_project_sessions(sessions: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Analyze work sessions for the project."""
-    sessions = get_project_sessions(project_id)
 
     if not sessions:
         return {"total_sessions": 0, "total_time": 0}
 
-    total_time = sum(s.get("duration_minutes", 0) for s in sessions)
-    completed_sessions = sum(1 for s in sessions if s.get("completed_at"))
+    total_time = 0
+    completed_sessions = 0
+    for s in sessions:
+        total_time += s.get("duration_minutes", 0)
+        if s.get("completed_at"):
+            completed_sessions += 1
 
     return {
         "total_sessions": len(sessions),
@@ -139,20 +143,11 @@ def _generate_project_suggestions(
 ) -> List[ProjectSuggestion]:
     """Generate bounded suggestions for project improvement."""
     try:
-        client = GeminiClient()
-
-        prompt = f"""
-        Analyze this project profile and provide up to 3 specific, actionable suggestions for improvement.
-        Focus on productivity, organization, or completion strategies.
-
-        Project Data:
-        {normalized_data}
+        client = get_gemini_client()
 
-        Return JSON array of suggestions, each with "category", "suggestion", "impact" (high/medium/low).
-        Keep each suggestion under 100 characters.
-        """
+        prompt = build_project_suggestions_prompt(normalized_data)
 
-        response = client.generate_json_response(prompt, max_tokens=300)
+        response = client.generate_json_response(prompt, max_tokens=300, cache=True)
 
         if not response or not isinstance(response, list):
             return []
@@ -177,5 +172,5 @@ def _generate_project_suggestions(
         return suggestions
 
     except Exception as e:
-        logger.warning(f"⚠️ Failed to generate project suggestions: {str(e)}")
+        logger.warning("⚠️ Failed to generate project suggestions: %s", e)
         return []
\ No newline at end of file
@@ -3,10 +3,16 @@ LLM prompt templates for agent MVP.
 Keep prompts short, bounded, and clear.
 """
 
+import json
 from typing import List, Optional, Dict, Any
 from agent_mvp.contracts import TaskCandidate, SelectionConstraints
 
 
+def _json_block(data: Dict[str, Any]) -> str:
+    """Compact, key-sorted JSON for embedding data in a prompt."""
+    return json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+
+
 def build_do_selector_prompt(
     candidates: List[TaskCandidate],
     constraints: SelectionConstraints,
@@ -18,10 +24,9 @@ def build_do_selector_prompt(
     Returns a prompt that results in JSON-only output.
     """
 
-    # Build candidate list
-    candidates_text = ""
-    for i, task in enumerate(candidates, 1):
-        candidates_text += f"""
+    # Build candidate list (joined once rather than grown by +=)
+    candidates_text = "".join(
+        f"""
 {i}. Task ID: {task.id}
    Title: {task.title}
    Priority: {task.priority}
@@ -29,6 +34,8 @@ def build_do_selector_prompt(
    Due: {task.due_at.isoformat() if task.due_at else 'No deadline'}
    Tags: {', '.join(task.tags) if task.tags else 'None'}
 """
+        for i, task in enumerate(candidates, 1)
+    )
 
     prompt = f"""You are a task selection agent. Select ONE task from the list below that best fits the user's current state.
 
@@ -123,7 +130,7 @@ def build_project_suggestions_prompt(normalized_data: Dict[str, Any]) -> str:
     Focus on productivity, organization, or completion strategies.
 
     Project Data:
-    {normalized_data}
+    {_json_block(normalized_data)}
 
     Return JSON array of suggestions, each with "category", "suggestion", "impact" (high/medium/low).
     Keep each suggestion under 100 characters.
@@ -167,7 +174,7 @@ def build_project_insights_prompt(
     Insight type: {insight_type}
 
     Project Data:
-    {project_data}
+    {_json_block(project_data)}
 
     Generate up to 3 refined insights that are:
     - Factual and data-driven
@@ -30,6 +30,38 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Task categories a check-in can focus on (order is kept in avoid_tags)
+_ALL_CATEGORIES = ("work", "personal", "health", "learning", "creative", "social", "maintenance")
+_CATEGORY_SET = frozenset(_ALL_CATEGORIES)
+
+# Map priorities to focus areas
+_PRIORITY_MAPPING = {
+    "work": ("work", "professional"),
+    "personal": ("personal", "home"),
+    "health": ("health", "fitness", "wellness"),
+    "learning": ("learning", "education", "skill"),
+    "creative": ("creative", "art", "design"),
+    "social": ("social", "community", "relationships"),
+}
+
+# Share of the stated focus time that is usable at each energy level
+_TIME_ENERGY_MULTIPLIER = {
+    1: 0.3,   # Very low energy = 30% of stated time
+    2: 0.5,   # Low energy = 50%
+    3: 0.7,   # Medium-low = 70%
+    4: 0.9,   # Medium-high = 90%
+    5: 1.0,   # Full energy = 100%
+}
+
+# Scale applied to the max task duration at each energy level
+_DURATION_ENERGY_MULTIPLIER = {
+    1: 0.5,   # Half duration for very low energy
+    2: 0.7,   # 70% for low energy
+    3: 0.9,   # 90% for medium-low
+    4: 1.0,   # Full for medium-high
+    5: 1.2,   # 120% for full energy (can handle longer tasks)
+}
+
 
 @track(name="state_adapter_agent")
 def adapt_checkin_to_constraints(
@@ -70,10 +102,9 @@ def adapt_checkin_to_constraints(
     # Extract focus areas and derive avoid_tags conservatively.
     # If user didn't specify focus areas, do not block broad categories.
     focus_areas = _extract_focus_areas(check_in)
-    all_categories = ["work", "personal", "health", "learning", "creative", "social", "maintenance"]
-    recognized_focus = [cat for cat in focus_areas if cat in all_categories]
+    recognized_focus = [cat for cat in focus_areas if cat in _CATEGORY_SET]
     if recognized_focus:
-        avoid_tags = [cat for cat in all_categories if cat not in recognized_focus]
+        avoid_tags = [cat for cat in _ALL_CATEGORIES if cat not in recognized_focus]
         if avoid_tags:
             constraints.avoid_tags = avoid_tags
 
@@ -83,7 +114,7 @@ def adapt_checkin_to_constraints(
     elif check_in.energy_level >= 8:
         constraints.prefer_priority = "high"
 
-    logger.info(f"✅ Constraints adapted: energy={constraints.current_energy}, time={constraints.max_minutes}, mode={constraints.mode}")
+    logger.info("✅ Constraints adapted: energy=%s, time=%s, mode=%s", constraints.current_energy, constraints.max_minutes, constraints.mode)
     return constraints
 
 
@@ -93,13 +124,7 @@ def _calculate_time_available(check_in: DailyCheckIn) -> int:
     base_time = check_in.focus_minutes or 120  # Default 2 hours
 
     # Adjust based on energy level
-    energy_multiplier = {
-        1: 0.3,   # Very low energy = 30% of stated time
-        2: 0.5,   # Low energy = 50%
-        3: 0.7,   # Medium-low = 70%
-        4: 0.9,   # Medium-high = 90%
-        5: 1.0,   # Full energy = 100%
-    }.get(check_in.energy_level, 1.0)
+    energy_multiplier = _TIME_ENERGY_MULTIPLIER.get(check_in.energy_level, 1.0)
 
     available = int(base_time * energy_multiplier)
 
@@ -111,29 +136,12 @@ def _extract_focus_areas(check_in: DailyCheckIn) -> List[str]:
     """Extract focus areas from check-in priorities."""
     focus_areas = []
 
-    # Map priorities to focus areas
-    priority_mapping = {
-        "work": ["work", "professional"],
-        "personal": ["personal", "home"],
-        "health": ["health", "fitness", "wellness"],
-        "learning": ["learning", "education", "skill"],
-        "creative": ["creative", "art", "design"],
-        "social": ["social", "community", "relationships"],
-    }
-
     for priority in check_in.priorities:
-        areas = priority_mapping.get(priority.lower(), [priority.lower()])
-        focus_areas.extend(areas)
+        priority = priority.lower()
+        focus_areas.extend(_PRIORITY_MAPPING.get(priority, (priority,)))
 
     # Remove duplicates while preserving order
-    seen = set()
-    unique_areas = []
-    for area in focus_areas:
-        if area not in seen:
-            seen.add(area)
-            unique_areas.append(area)
-
-    return unique_areas[:5]  # Limit to 5 focus areas
+    return list(dict.fromkeys(focus_areas))[:5]  # Limit to 5 focus areas
 
 
 def _determine_blocked_categories(
@@ -154,12 +162,11 @@ def _determine_blocked_categories(
             blocked.append("challenging")  # Block challenging tasks on low-energy days
 
     # Block based on stated priorities (focus on what's important)
-    all_categories = ["work", "personal", "health", "learning", "creative", "social", "maintenance"]
     stated_priorities = [p.lower() for p in check_in.priorities]
 
     # Block categories not in priorities (if priorities specified)
     if stated_priorities:
-        for category in all_categories:
+        for category in _ALL_CATEGORIES:
             if category not in stated_priorities and category not in ["maintenance"]:  # Always allow maintenance
                 blocked.append(category)
 
@@ -182,13 +189,7 @@ def _calculate_max_task_duration(constraints: SelectionConstraints) -> int:
         base_max = 120
 
     # Adjust for energy
-    energy_multiplier = {
-        1: 0.5,   # Half duration for very low energy
-        2: 0.7,   # 70% for low energy
-        3: 0.9,   # 90% for medium-low
-        4: 1.0,   # Full for medium-high
-        5: 1.2,   # 120% for full energy (can handle longer tasks)
-    }.get(energy_level, 1.0)
+    energy_multiplier = _DURATION_ENERGY_MULTIPLIER.get(energy_level, 1.0)
 
     max_duration = int(base_max * energy_multiplier)
 
@@ -14,9 +14,13 @@ New tables to support:
 All operations use _get_agent_supabase() helper.
 """
 
-from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta, date
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone, date
+from core.config import get_settings
 from core.supabase import get_supabase, get_supabase_admin
+from agent_mvp.io_pool import run_independent
 from opik import track
 import logging
 
@@ -24,6 +28,10 @@ logger = logging.getLogger(__name__)
 
 _agent_service_role_warning_logged = False
 
+# Shared by project reads when AGENT_PARALLEL_IO is on; built on first use.
+_project_io_pool: Optional[ThreadPoolExecutor] = None
+_project_io_pool_lock = threading.Lock()
+
 
 def _get_agent_supabase():
     """Prefer service-role client for agent writes; fallback safely if missing."""
@@ -62,35 +70,94 @@ def _json_safe(value: Any) -> Any:
 
 # ===== ACTIVE DO OPERATIONS =====
 
+def _active_do_row(active_do: Dict[str, Any], updated_at: Optional[str] = None) -> Dict[str, Any]:
+    """Build the JSON-safe active_do row shared by upsert and RPC writes."""
+    started_at = active_do.get("started_at")
+    if hasattr(started_at, "isoformat"):
+        started_at = started_at.isoformat()
+
+    return {
+        "user_id": active_do["user_id"],
+        "task": _json_safe(active_do.get("task")),
+        "selection_reason": active_do.get("selection_reason"),
+        "coaching_message": active_do.get("coaching_message"),
+        "started_at": started_at,
+        "updated_at": updated_at or datetime.now(timezone.utc).isoformat(),
+    }
+
+
 @track(name="storage_save_active_do")
 def save_active_do(active_do: Dict[str, Any]) -> None:
     """Save active do state (task payload stored as JSONB)."""
     if not active_do.get("task"):
-        logger.warning(f"⚠️ active_do not saved: no selected task for user {active_do.get('user_id')}")
+        logger.warning("⚠️ active_do not saved: no selected task for user %s", active_do.get('user_id'))
         return
 
     try:
         supabase = _get_agent_supabase()
-        started_at = active_do.get("started_at")
-        if hasattr(started_at, "isoformat"):
-            started_at = started_at.isoformat()
+        supabase.table("active_do").upsert(
+            _active_do_row(active_do),
+            on_conflict="user_id",
+        ).execute()
+        logger.info("💾 Saved active do for user %s", active_do['user_id'])
+    except Exception as e:
+        logger.warning("⚠️ Failed to save active do (non-blocking): %s", e)
 
-        task_payload = _json_safe(active_do.get("task"))
 
-        supabase.table("active_do").upsert(
+@track(name="storage_save_active_dos")
+def save_active_dos(active_dos: List[Dict[str, Any]]) -> None:
+    """Upsert several users' active do rows in one request (one row per user)."""
+    rows = [_active_do_row(active_do) for active_do in active_dos if active_do.get("task")]
+    if not rows:
+        return
+    try:
+        supabase = _get_agent_supabase()
+        supabase.table("active_do").upsert(rows, on_conflict="user_id").execute()
+        logger.info("💾 Saved %s active dos", len(rows))
+    except Exception as e:
+        logger.warning("⚠️ Failed to save active dos (non-blocking): %s", e)
+
+
+@track(name="storage_finalize_selection")
+def finalize_selection(
+    active_do: Dict[str, Any],
+    agent_event: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Save active do and its agent event in one transactional RPC.
+
+    Falls back to the individual save_active_do/log_agent_event writes when
+    the finalize_selection function (migration 005) is unavailable.
+    """
+    if not active_do.get("task"):
+        logger.warning("⚠️ active_do not saved: no selected task for user %s", active_do.get('user_id'))
+        if agent_event:
+            log_agent_event(agent_event["user_id"], agent_event["event_type"], agent_event.get("event_data", {}))
+        return
+
+    if not agent_event:
+        save_active_do(active_do)
+        return
+
+    written_at = datetime.now(timezone.utc).isoformat()
+    try:
+        supabase = _get_agent_supabase()
+        supabase.rpc(
+            "finalize_selection",
             {
-                "user_id": active_do["user_id"],
-                "task": task_payload,
-                "selection_reason": active_do.get("selection_reason"),
-                "coaching_message": active_do.get("coaching_message"),
-                "started_at": started_at,
-                "updated_at": datetime.utcnow().isoformat(),
+                "p_active_do": _active_do_row(active_do, written_at),
+                "p_agent_event": {
+                    "user_id": agent_event["user_id"],
+                    "event_type": agent_event["event_type"],
+                    "event_data": _json_safe(agent_event.get("event_data", {})),
+                    "timestamp": written_at,
+                },
             },
-            on_conflict="user_id",
         ).execute()
-        logger.info(f"💾 Saved active do for user {active_do['user_id']}")
+        logger.info("💾 Finalized selection for user %s", active_do['user_id'])
     except Exception as e:
-        logger.warning(f"⚠️ Failed to save active do (non-blocking): {str(e)}")
+        logger.warning("⚠️ finalize_selection RPC failed, using individual writes: %s", e)
+        save_active_do(active_do)
+        log_agent_event(agent_event["user_id"], agent_event["event_type"], agent_event.get("event_data", {}))
 
 
 @track(name="storage_get_active_do")
@@ -102,7 +169,7 @@ def get_active_do(user_id: str) -> Optional[Dict[str, Any]]:
         return result.data[0] if result.data else None
     except Exception as e:
         # Non-blocking - log and return None
-        logger.warning(f"⚠️ Failed to get active do (non-blocking): {str(e)}")
+        logger.warning("⚠️ Failed to get active do (non-blocking): %s", e)
         return None
 
 
@@ -118,10 +185,10 @@ def save_session_state(user_id: str, state: Dict[str, Any]) -> None:
             "state_data": state,
             "updated_at": datetime.utcnow().isoformat(),
         }).execute()
-        logger.info(f"💾 Saved session state for user {user_id}")
+        logger.info("💾 Saved session state for user %s", user_id)
     except Exception as e:
         # Non-blocking - log and continue
-        logger.warning(f"⚠️ Failed to save session state (non-blocking): {str(e)}")
+        logger.warning("⚠️ Failed to save session state (non-blocking): %s", e)
 
 
 @track(name="storage_get_session_state")
@@ -135,7 +202,7 @@ def get_session_state(user_id: str) -> Optional[Dict[str, Any]]:
         return None
     except Exception as e:
         # Non-blocking - log and return None
-        logger.warning(f"⚠️ Failed to get session state (non-blocking): {str(e)}")
+        logger.warning("⚠️ Failed to get session state (non-blocking): %s", e)
         return None
 
 
@@ -154,9 +221,9 @@ def save_stuck_episode(episode: Dict[str, Any]) -> None:
             "time_stuck": episode["time_stuck"],
             "detected_at": episode["detected_at"].isoformat(),
         }).execute()
-        logger.info(f"💾 Saved stuck episode for user {episode['user_id']}")
+        logger.info("💾 Saved stuck episode for user %s", episode['user_id'])
     except Exception as e:
-        logger.error(f"❌ Failed to save stuck episode: {str(e)}")
+        logger.error("❌ Failed to save stuck episode: %s", e)
         raise
 
 
@@ -169,7 +236,7 @@ def get_recent_stuck_episodes(user_id: str, hours: int = 24) -> List[Dict[str, A
         result = supabase.table("stuck_episodes").select("*").eq("user_id", user_id).gte("detected_at", since.isoformat()).execute()
         return result.data
     except Exception as e:
-        logger.error(f"❌ Failed to get stuck episodes: {str(e)}")
+        logger.error("❌ Failed to get stuck episodes: %s", e)
         return []
 
 
@@ -185,9 +252,9 @@ def save_time_patterns(user_id: str, patterns: Dict[str, Any]) -> None:
             "patterns": patterns,
             "updated_at": datetime.utcnow().isoformat(),
         }).execute()
-        logger.info(f"💾 Saved time patterns for user {user_id}")
+        logger.info("💾 Saved time patterns for user %s", user_id)
     except Exception as e:
-        logger.error(f"❌ Failed to save time patterns: {str(e)}")
+        logger.error("❌ Failed to save time patterns: %s", e)
         raise
 
 
@@ -201,7 +268,7 @@ def get_time_patterns(user_id: str) -> Optional[Dict[str, Any]]:
             return result.data[0]["patterns"]
         return None
     except Exception as e:
-        logger.error(f"❌ Failed to get time patterns: {str(e)}")
+        logger.error("❌ Failed to get time patterns: %s", e)
         return None
 
 
@@ -219,9 +286,9 @@ def save_session_insights(insights: Dict[str, Any]) -> None:
             "motivation": insights["motivation"],
             "generated_at": datetime.utcnow().isoformat(),
         }).execute()
-        logger.info(f"💾 Saved insights for user {insights['user_id']}")
+        logger.info("💾 Saved insights for user %s", insights['user_id'])
     except Exception as e:
-        logger.error(f"❌ Failed to save insights: {str(e)}")
+        logger.error("❌ Failed to save insights: %s", e)
         raise
 
 
@@ -234,7 +301,7 @@ def get_recent_insights(user_id: str, days: int = 7) -> List[Dict[str, Any]]:
         result = supabase.table("insights").select("*").eq("user_id", user_id).gte("date", since.isoformat()).execute()
         return result.data
     except Exception as e:
-        logger.error(f"❌ Failed to get insights: {str(e)}")
+        logger.error("❌ Failed to get insights: %s", e)
         return []
 
 
@@ -254,9 +321,9 @@ def save_gamification_state(user_id: str, state: Dict[str, Any]) -> None:
             "last_activity_date": state["last_activity_date"].isoformat() if state["last_activity_date"] else None,
             "updated_at": datetime.utcnow().isoformat(),
         }).execute()
-        logger.info(f"💾 Saved gamification state for user {user_id}")
+        logger.info("💾 Saved gamification state for user %s", user_id)
     except Exception as e:
-        logger.error(f"❌ Failed to save gamification state: {str(e)}")
+        logger.error("❌ Failed to save gamification state: %s", e)
         raise
 
 
@@ -268,7 +335,7 @@ def get_gamification_state(user_id: str) -> Optional[Dict[str, Any]]:
         result = supabase.table("gamification_state").select("*").eq("user_id", user_id).execute()
         return result.data[0] if result.data else None
     except Exception as e:
-        logger.error(f"❌ Failed to get gamification state: {str(e)}")
+        logger.error("❌ Failed to get gamification state: %s", e)
         return None
 
 
@@ -287,9 +354,9 @@ def save_xp_ledger_entry(entry: Dict[str, Any]) -> None:
             "metadata": entry["metadata"],
             "timestamp": entry["timestamp"].isoformat(),
         }).execute()
-        logger.info(f"💾 Saved XP ledger entry for user {entry['user_id']}")
+        logger.info("💾 Saved XP ledger entry for user %s", entry['user_id'])
     except Exception as e:
-        logger.error(f"❌ Failed to save XP ledger: {str(e)}")
+        logger.error("❌ Failed to save XP ledger: %s", e)
         raise
 
 
@@ -302,7 +369,7 @@ def get_xp_history(user_id: str, days: int = 30) -> List[Dict[str, Any]]:
         result = supabase.table("xp_ledger").select("*").eq("user_id", user_id).gte("timestamp", since.isoformat()).order("timestamp", desc=True).execute()
         return result.data
     except Exception as e:
-        logger.error(f"❌ Failed to get XP history: {str(e)}")
+        logger.error("❌ Failed to get XP history: %s", e)
         return []
 
 
@@ -319,9 +386,22 @@ def log_agent_event(user_id: str, event_type: str, event_data: Dict[str, Any]) -
             "event_data": event_data,
             "timestamp": datetime.utcnow().isoformat(),
         }).execute()
-        logger.info(f"📝 Logged agent event: {event_type} for user {user_id}")
+        logger.info("📝 Logged agent event: %s for user %s", event_type, user_id)
+    except Exception as e:
+        logger.warning("⚠️ Failed to log agent event (non-blocking): %s", e)
+
+
+@track(name="storage_log_agent_events")
+def log_agent_events(events: List[Dict[str, Any]]) -> None:
+    """Bulk-insert agent events (user_id, event_type, event_data, timestamp) in one request."""
+    if not events:
+        return
+    try:
+        supabase = _get_agent_supabase()
+        supabase.table("agent_events").insert(events).execute()
+        logger.info("📝 Logged %s agent events", len(events))
     except Exception as e:
-        logger.warning(f"⚠️ Failed to log agent event (non-blocking): {str(e)}")
+        logger.warning("⚠️ Failed to log agent events (non-blocking): %s", e)
 
 
 @track(name="storage_get_agent_events")
@@ -338,7 +418,7 @@ def get_agent_events(user_id: str, event_type: str = None, hours: int = 24) -> L
         result = query.gte("timestamp", since.isoformat()).order("timestamp", desc=True).execute()
         return result.data
     except Exception as e:
-        logger.warning(f"⚠️ Failed to get agent events (non-blocking): {str(e)}")
+        logger.warning("⚠️ Failed to get agent events (non-blocking): %s", e)
         return []
 
 
@@ -353,7 +433,7 @@ def get_user_sessions(user_id: str, days: int = 30) -> List[Dict[str, Any]]:
         result = supabase.table("work_sessions").select("*").eq("user_id", user_id).gte("created_at", since.isoformat()).execute()
         return result.data
     except Exception as e:
-        logger.error(f"❌ Failed to get user sessions: {str(e)}")
+        logger.error("❌ Failed to get user sessions: %s", e)
         return []
 
 
@@ -371,7 +451,7 @@ def get_user_tasks(user_id: str, completed_only: bool = False, days: int = 30) -
         result = query.gte("created_at", since.isoformat()).execute()
         return result.data
     except Exception as e:
-        logger.error(f"❌ Failed to get user tasks: {str(e)}")
+        logger.error("❌ Failed to get user tasks: %s", e)
         return []
 
 
@@ -384,7 +464,7 @@ def get_user_checkins(user_id: str, days: int = 30) -> List[Dict[str, Any]]:
         result = supabase.table("daily_check_ins").select("*").eq("user_id", user_id).gte("created_at", since.isoformat()).execute()
         return result.data
     except Exception as e:
-        logger.error(f"❌ Failed to get user checkins: {str(e)}")
+        logger.error("❌ Failed to get user checkins: %s", e)
         return []
 
 
@@ -412,7 +492,7 @@ def save_ai_learning(
     try:
         # Newer schema (migration 003): includes expires_at + updated_at.
         supabase.table("ai_learning_data").upsert(full_payload).execute()
-        logger.info(f"Saved AI learning data for user {user_id}, agent {agent_type}")
+        logger.info("Saved AI learning data for user %s, agent %s", user_id, agent_type)
     except Exception as e:
         error_text = str(e)
 
@@ -429,10 +509,10 @@ def save_ai_learning(
                 )
                 return
             except Exception as fallback_error:
-                logger.error(f"Failed to save AI learning (legacy fallback): {fallback_error}")
+                logger.error("Failed to save AI learning (legacy fallback): %s", fallback_error)
                 raise
 
-        logger.error(f"Failed to save AI learning: {error_text}")
+        logger.error("Failed to save AI learning: %s", error_text)
         raise
 
 
@@ -478,13 +558,14 @@ def get_task_candidates(user_id: str, constraints: Any) -> List[Dict[str, Any]]:
                 candidates.append(task)
 
         logger.info(
-            f"Task candidate scan for user {user_id}: total={total_tasks}, "
-            f"after_filters={len(candidates)}, energy={normalized.get('current_energy')}, "
-            f"max_minutes={normalized.get('max_minutes')}, avoid_tags={len(normalized.get('avoid_tags', []))}"
+            "Task candidate scan for user %s: total=%s, after_filters=%s, energy=%s, "
+            "max_minutes=%s, avoid_tags=%s",
+            user_id, total_tasks, len(candidates), normalized.get("current_energy"),
+            normalized.get("max_minutes"), len(normalized.get("avoid_tags", [])),
         )
         return candidates[:20]  # Limit candidates
     except Exception as e:
-        logger.error(f"❌ Failed to get task candidates: {str(e)}")
+        logger.error("❌ Failed to get task candidates: %s", e)
         return []
 
 
@@ -529,7 +610,7 @@ def get_project_data(project_id: str, user_id: str) -> Optional[Dict[str, Any]]:
         result = supabase.table("projects").select("*").eq("id", project_id).eq("user_id", user_id).execute()
         return result.data[0] if result.data else None
     except Exception as e:
-        logger.error(f"❌ Failed to get project data: {str(e)}")
+        logger.error("❌ Failed to get project data: %s", e)
         return None
 
 
@@ -541,7 +622,7 @@ def get_project_tasks(project_id: str) -> List[Dict[str, Any]]:
         result = supabase.table("tasks").select("*").eq("project_id", project_id).execute()
         return result.data
     except Exception as e:
-        logger.error(f"❌ Failed to get project tasks: {str(e)}")
+        logger.error("❌ Failed to get project tasks: %s", e)
         return []
 
 
@@ -553,7 +634,7 @@ def get_project_sessions(project_id: str) -> List[Dict[str, Any]]:
         result = supabase.table("work_sessions").select("*").eq("project_id", project_id).execute()
         return result.data
     except Exception as e:
-        logger.error(f"❌ Failed to get project sessions: {str(e)}")
+        logger.error("❌ Failed to get project sessions: %s", e)
         return []
 
 
@@ -567,10 +648,46 @@ def get_project_checkins(project_id: str, days: int = 30) -> List[Dict[str, Any]
         result = supabase.table("daily_check_ins").select("*").gte("created_at", since.isoformat()).execute()
         return result.data
     except Exception as e:
-        logger.error(f"❌ Failed to get project checkins: {str(e)}")
+        logger.error("❌ Failed to get project checkins: %s", e)
         return []
 
 
+def _get_project_io_pool() -> Optional[ThreadPoolExecutor]:
+    """Shared pool for project reads, or None when AGENT_PARALLEL_IO is off."""
+    global _project_io_pool
+    if not get_settings().agent_parallel_io:
+        return None
+    if _project_io_pool is None:
+        with _project_io_pool_lock:
+            if _project_io_pool is None:
+                _project_io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="project-io")
+    return _project_io_pool
+
+
+@track(name="storage_get_project_bundle")
+def get_project_bundle(
+    project_id: str,
+    user_id: str,
+    checkin_days: Optional[int] = None,
+) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Get project, tasks, sessions and (if checkin_days is set) check-ins in one call.
+
+    The project is read first so nothing else is fetched for a project the
+    user does not own; tasks, sessions and check-ins are then independent.
+    """
+    project = get_project_data(project_id, user_id)
+    if not project:
+        return None, [], [], []
+
+    tasks, sessions, checkins = run_independent(
+        _get_project_io_pool(),
+        lambda: get_project_tasks(project_id),
+        lambda: get_project_sessions(project_id),
+        lambda: get_project_checkins(project_id, checkin_days) if checkin_days is not None else [],
+    )
+    return project, tasks, sessions, checkins
+
+
 @track(name="storage_get_user_profile")
 def get_user_profile(user_id: str) -> Optional[Dict[str, Any]]:
     """Get user profile from ai_learning_data."""
@@ -581,7 +698,7 @@ def get_user_profile(user_id: str) -> Optional[Dict[str, Any]]:
             return result.data[0]["data"]
         return None
     except Exception as e:
-        logger.error(f"❌ Failed to get user profile: {str(e)}")
+        logger.error("❌ Failed to get user profile: %s", e)
         return None
 
 
@@ -605,13 +722,13 @@ def update_session_status(task_id: str, status: str) -> None:
             update_data["end_time"] = now_iso
 
         if not update_data:
-            logger.info(f"ℹ️ No work session fields to update for task {task_id}: {status}")
+            logger.info("ℹ️ No work session fields to update for task %s: %s", task_id, status)
             return
 
         supabase.table("work_sessions").update(update_data).eq("task_id", task_id).execute()
-        logger.info(f"✅ Updated session timing for task {task_id}: {status}")
+        logger.info("✅ Updated session timing for task %s: %s", task_id, status)
     except Exception as e:
-        logger.warning(f"⚠️ Failed to update session status (non-blocking): {str(e)}")
+        logger.warning("⚠️ Failed to update session status (non-blocking): %s", e)
 
 
 @track(name="storage_get_recent_sessions")
@@ -623,7 +740,7 @@ def get_recent_sessions(user_id: str, hours: int = 24) -> List[Dict[str, Any]]:
         result = supabase.table("work_sessions").select("*").eq("user_id", user_id).gte("created_at", since.isoformat()).execute()
         return result.data
     except Exception as e:
-        logger.error(f"❌ Failed to get recent sessions: {str(e)}")
+        logger.error("❌ Failed to get recent sessions: %s", e)
         return []
 
 
@@ -640,5 +757,5 @@ def get_session_patterns(user_id: str, days: int = 7) -> Dict[str, Any]:
         result = supabase.table("work_sessions").select("*").eq("user_id", user_id).gte("created_at", since.isoformat()).execute()
         return {"recent_sessions": result.data or []}
     except Exception as e:
-        logger.error(f"❌ Failed to get session patterns: {str(e)}")
+        logger.error("❌ Failed to get session patterns: %s", e)
         return fallback
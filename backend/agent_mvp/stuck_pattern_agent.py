@@ -27,7 +27,7 @@ from agent_mvp.contracts import (
     WorkSession,
 )
 from agent_mvp.storage import get_session_patterns, get_active_do, save_stuck_episode, get_recent_stuck_episodes
-from agent_mvp.gemini_client import GeminiClient
+from agent_mvp.gemini_client import get_gemini_client
 from opik import track
 import logging
 
@@ -47,7 +47,7 @@ def detect_stuck_patterns(
     Returns:
         Stuck analysis with microtasks if stuck
     """
-    logger.info(f"🕳️ Detecting stuck patterns for user {request.user_id}")
+    logger.info("🕳️ Detecting stuck patterns for user %s", request.user_id)
 
     analysis = StuckAnalysis()
 
@@ -64,7 +64,7 @@ def detect_stuck_patterns(
         # Save stuck episode
         _save_stuck_episode(request, analysis.stuck_reason)
 
-        logger.info(f"⚠️ User stuck: {analysis.stuck_reason}")
+        logger.info("⚠️ User stuck: %s", analysis.stuck_reason)
     else:
         logger.info("✅ User not stuck")
 
@@ -170,7 +170,7 @@ def _generate_microtasks(request: StuckDetectionRequest) -> List[Microtask]:
 def _enhance_microtasks_with_llm(session: WorkSession, base_tasks: List[str]) -> Optional[List[str]]:
     """Use LLM to generate more specific microtasks."""
     try:
-        client = GeminiClient()
+        client = get_gemini_client()
 
         prompt = f"""
         A user is stuck on this task: "{session.task_title or 'Unknown task'}"
@@ -195,7 +195,7 @@ def _enhance_microtasks_with_llm(session: WorkSession, base_tasks: List[str]) ->
             return valid_tasks
 
     except Exception as e:
-        logger.warning(f"⚠️ LLM microtask enhancement failed: {str(e)}")
+        logger.warning("⚠️ LLM microtask enhancement failed: %s", e)
 
     return None
 
@@ -212,6 +212,6 @@ def _save_stuck_episode(request: StuckDetectionRequest, reason: str) -> None:
             "detected_at": datetime.utcnow(),
         }
         save_stuck_episode(episode)
-        logger.info(f"💾 Saved stuck episode for user {request.user_id}")
+        logger.info("💾 Saved stuck episode for user %s", request.user_id)
     except Exception as e:
-        logger.warning(f"⚠️ Failed to save stuck episode: {str(e)}")
\ No newline at end of file
+        logger.warning("⚠️ Failed to save stuck episode: %s", e)
\ No newline at end of file
@@ -45,7 +45,7 @@ def learn_time_patterns(
     Returns:
         Learned time patterns
     """
-    logger.info(f"⏰ Learning time patterns for user {request.user_id}")
+    logger.info("⏰ Learning time patterns for user %s", request.user_id)
 
     # Get historical data
     sessions = get_user_sessions(request.user_id, days=request.analysis_window_days)
@@ -68,7 +68,7 @@ def learn_time_patterns(
     # Save patterns for reuse
     _save_time_patterns(request.user_id, patterns)
 
-    logger.info(f"✅ Time patterns learned for user {request.user_id}")
+    logger.info("✅ Time patterns learned for user %s", request.user_id)
     return patterns
 
 
@@ -240,6 +240,6 @@ def _save_time_patterns(user_id: str, patterns: TimePatterns) -> None:
             data=patterns.model_dump(),
             expires_at=datetime.utcnow() + timedelta(days=14),  # Refresh bi-weekly
         )
-        logger.info(f"💾 Saved time patterns for user {user_id}")
+        logger.info("💾 Saved time patterns for user %s", user_id)
     except Exception as e:
-        logger.warning(f"⚠️ Failed to save time patterns: {str(e)}")
\ No newline at end of file
+        logger.warning("⚠️ Failed to save time patterns: %s", e)
\ No newline at end of file
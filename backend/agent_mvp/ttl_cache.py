@@ -0,0 +1,68 @@
+"""
+TTL cache - small thread-safe cache shared by the agent layer.
+
+Entries expire ``ttl`` seconds after they are stored and the oldest entry is
+evicted once ``max_size`` is reached. Entries may be tagged with a group
+(e.g. a user id) so everything for that group can be dropped at once.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional
+
+
+class TTLCache:
+    """FIFO cache with per-entry expiry; a TTL of 0 means callers should bypass it."""
+
+    def __init__(self, ttl: float, max_size: int):
+        self.ttl = ttl
+        self.max_size = max_size
+        # key -> (expires_at, group, value); dict order is insertion order.
+        self._entries: Dict[Hashable, tuple] = {}
+        self._groups: Dict[Hashable, set] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value stored under key, or default if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return default
+        return entry[2]
+
+    def set(self, key: Hashable, value: Any, group: Optional[Hashable] = None) -> None:
+        """Store value under key, evicting the oldest entry when full."""
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            # Re-inserting moves a refreshed key to the back of the eviction order.
+            self._pop(key)
+            if len(self._entries) >= self.max_size:
+                self._pop(next(iter(self._entries)))
+            self._entries[key] = (expires_at, group, value)
+            if group is not None:
+                self._groups.setdefault(group, set()).add(key)
+
+    def discard(self, key: Hashable) -> None:
+        """Drop a single entry if present."""
+        with self._lock:
+            self._pop(key)
+
+    def invalidate(self, group: Hashable) -> None:
+        """Drop every entry stored under group."""
+        with self._lock:
+            for key in self._groups.pop(group, ()):
+                self._entries.pop(key, None)
+
+    def _pop(self, key: Hashable) -> None:
+        """Remove key and its group membership; caller holds the lock."""
+        entry = self._entries.pop(key, None)
+        if entry is None or entry[1] is None:
+            return
+        keys = self._groups.get(entry[1])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._groups[entry[1]]
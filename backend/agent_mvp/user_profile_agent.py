@@ -65,7 +65,7 @@ def analyze_user_profile(
     Returns:
         UserProfileAnalysis with patterns and preferences
     """
-    logger.info(f"📊 Analyzing profile for user {user_id}")
+    logger.info("📊 Analyzing profile for user %s", user_id)
 
     analysis = UserProfileAnalysis()
 
@@ -84,7 +84,7 @@ def analyze_user_profile(
     # Save analysis for reuse
     _save_profile_analysis(user_id, analysis)
 
-    logger.info(f"✅ Profile analysis complete for user {user_id}")
+    logger.info("✅ Profile analysis complete for user %s", user_id)
     return analysis
 
 
@@ -195,6 +195,6 @@ def _save_profile_analysis(user_id: str, analysis: UserProfileAnalysis) -> None:
             data=analysis.model_dump(),
             expires_at=datetime.utcnow() + timedelta(days=30),  # Refresh monthly
         )
-        logger.info(f"💾 Saved profile analysis for user {user_id}")
+        logger.info("💾 Saved profile analysis for user %s", user_id)
     except Exception as e:
-        logger.warning(f"⚠️ Failed to save profile analysis: {str(e)}")
+        logger.warning("⚠️ Failed to save profile analysis: %s", e)
@@ -46,14 +46,14 @@ def validate_do_selector_output(
         valid_alts = [aid for aid in output.alt_task_ids if aid in candidate_ids]
         output.alt_task_ids = valid_alts
 
-        logger.info(f"✅ Valid DoSelector output: {output.task_id}")
+        logger.info("✅ Valid DoSelector output: %s", output.task_id)
         return output, True
 
     except ValueError as e:
-        logger.warning(f"❌ Invalid DoSelector output format: {str(e)}")
+        logger.warning("❌ Invalid DoSelector output format: %s", e)
         return fallback_do_selector(candidates), False
     except Exception as e:
-        logger.error(f"❌ Unexpected error validating DoSelector: {str(e)}")
+        logger.error("❌ Unexpected error validating DoSelector: %s", e)
         return fallback_do_selector(candidates), False
 
 
@@ -67,11 +67,11 @@ def validate_coach_output(raw_output: dict) -> Tuple[CoachOutput, bool]:
     """
     try:
         output = CoachOutput(**raw_output)
-        logger.info(f"✅ Valid Coach output: {output.title}")
+        logger.info("✅ Valid Coach output: %s", output.title)
         return output, True
 
     except ValueError as e:
-        logger.warning(f"❌ Invalid Coach output: {str(e)}")
+        logger.warning("❌ Invalid Coach output: %s", e)
         return CoachOutput(
             title="Let's go",
             message="You've got this.",
@@ -79,7 +79,7 @@ def validate_coach_output(raw_output: dict) -> Tuple[CoachOutput, bool]:
         ), False
 
     except Exception as e:
-        logger.error(f"❌ Unexpected error validating Coach: {str(e)}")
+        logger.error("❌ Unexpected error validating Coach: %s", e)
         return CoachOutput(
             title="Let's go",
             message="You've got this.",
@@ -129,11 +129,11 @@ def validate_project_suggestions(raw_output: List[Dict[str, Any]]) -> Tuple[List
                 )
                 suggestions.append(suggestion)
         except Exception as e:
-            logger.warning(f"❌ Invalid suggestion item: {str(e)}")
+            logger.warning("❌ Invalid suggestion item: %s", e)
             continue
 
     is_valid = len(suggestions) > 0
-    logger.info(f"✅ Valid project suggestions: {len(suggestions)} items")
+    logger.info("✅ Valid project suggestions: %s items", len(suggestions))
     return suggestions, is_valid
 
 
@@ -159,11 +159,11 @@ def validate_stuck_microtasks(raw_output: List[str]) -> Tuple[List[Microtask], b
                 )
                 microtasks.append(microtask)
         except Exception as e:
-            logger.warning(f"❌ Invalid microtask item: {str(e)}")
+            logger.warning("❌ Invalid microtask item: %s", e)
             continue
 
     is_valid = len(microtasks) > 0
-    logger.info(f"✅ Valid stuck microtasks: {len(microtasks)} items")
+    logger.info("✅ Valid stuck microtasks: %s items", len(microtasks))
     return microtasks, is_valid
 
 
@@ -189,11 +189,11 @@ def validate_project_insights(raw_output: List[str]) -> Tuple[List[Insight], boo
                 )
                 insights.append(insight)
         except Exception as e:
-            logger.warning(f"❌ Invalid insight item: {str(e)}")
+            logger.warning("❌ Invalid insight item: %s", e)
             continue
 
     is_valid = len(insights) > 0
-    logger.info(f"✅ Valid project insights: {len(insights)} items")
+    logger.info("✅ Valid project insights: %s items", len(insights))
     return insights, is_valid
 
 
@@ -217,7 +217,7 @@ def validate_motivation_message(raw_output: str) -> Tuple[str, bool]:
         logger.warning("❌ Motivation message too short")
         return "You've got this!", False
 
-    logger.info(f"✅ Valid motivation message: {len(message)} chars")
+    logger.info("✅ Valid motivation message: %s chars", len(message))
     return message, True
 
 
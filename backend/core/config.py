@@ -43,6 +43,14 @@ class Settings(BaseSettings):
     # Google Gemini Configuration (optional for local testing)
     google_api_key: Optional[str] = None
 
+    # Agent orchestrator
+    agent_parallel_io: bool = False  # Overlap independent agent calls on a thread pool
+    agent_background_writes: bool = False  # Queue fire-and-forget storage writes off the request path
+    agent_candidate_cache_ttl: float = 0.0  # Seconds to reuse a user's task candidates; 0 disables
+    agent_checkin_cache_ttl: float = 0.0  # Seconds to reuse a user's check-in in do_next; 0 disables
+    agent_llm_concurrency: int = 8  # Max Gemini requests in flight per process
+    agent_llm_cache_ttl: float = 0.0  # Seconds to reuse a valid answer to an identical Gemini prompt for callers that opt in; 0 disables
+
     class Config:
         env_file = ".env"
         case_sensitive = False
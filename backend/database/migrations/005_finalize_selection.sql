@@ -0,0 +1,40 @@
+-- finalize_selection RPC
+-- Persists the selected active_do and its agent_events row in one round-trip.
+-- Both writes run inside the function's transaction, so an event is never
+-- logged for a selection that failed to save (and vice versa).
+
+CREATE OR REPLACE FUNCTION finalize_selection(
+    p_active_do JSONB,
+    p_agent_event JSONB DEFAULT NULL
+)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    INSERT INTO active_do (user_id, task, selection_reason, coaching_message, started_at, updated_at)
+    VALUES (
+        (p_active_do->>'user_id')::UUID,
+        p_active_do->'task',
+        p_active_do->>'selection_reason',
+        p_active_do->>'coaching_message',
+        COALESCE((p_active_do->>'started_at')::TIMESTAMPTZ, NOW()),
+        NOW()
+    )
+    ON CONFLICT (user_id) DO UPDATE SET
+        task = EXCLUDED.task,
+        selection_reason = EXCLUDED.selection_reason,
+        coaching_message = EXCLUDED.coaching_message,
+        started_at = EXCLUDED.started_at,
+        updated_at = EXCLUDED.updated_at;
+
+    IF p_agent_event IS NOT NULL THEN
+        INSERT INTO agent_events (user_id, event_type, event_data, timestamp)
+        VALUES (
+            (p_agent_event->>'user_id')::UUID,
+            p_agent_event->>'event_type',
+            COALESCE(p_agent_event->'event_data', '{}'::JSONB),
+            COALESCE((p_agent_event->>'timestamp')::TIMESTAMPTZ, NOW())
+        );
+    END IF;
+END;
+$$;
@@ -11,6 +11,7 @@ Provides:
 - POST /agent-mvp/insights - Get project insights
 """
 
+import asyncio
 from fastapi import APIRouter, HTTPException, status, Depends
 from typing import Optional
 from datetime import datetime
@@ -25,7 +26,7 @@ from agent_mvp.contracts import (
     DayEndEvent,
     ProjectInsightRequest,
 )
-from agent_mvp.orchestrator import process_agent_event
+from agent_mvp.orchestrator import aprocess_agent_event
 from agent_mvp.events import log_agent_event
 from agent_mvp.project_insight_agent import generate_project_insights
 from agent_mvp.storage import get_active_do
@@ -95,11 +96,11 @@ async def next_do(
             constraints=constraints,
         )
         try:
-            log_agent_event(user_id, "DO_NEXT", {"context": event.context})
+            await asyncio.to_thread(log_agent_event, user_id, "DO_NEXT", {"context": event.context})
         except Exception as event_err:
             logger.warning(f"DO_NEXT event logging failed (non-blocking): {event_err}")
 
-        result = process_agent_event(event)
+        result = await aprocess_agent_event(event)
 
         if not result.get("success"):
             logger.error(f"❌ Agent MVP failed: {result.get('error')}")
@@ -128,7 +129,7 @@ async def get_active_do_endpoint(
 ) -> AgentMVPResponse:
     """Return the most recent active_do stored for the user."""
     user_id = current_user["id"]
-    record = get_active_do(user_id)
+    record = await asyncio.to_thread(get_active_do, user_id)
     if not record:
         return AgentMVPResponse(success=True, data={})
 
@@ -173,7 +174,7 @@ async def app_open(
             current_time=request.current_time or datetime.utcnow(),
         )
 
-        result = process_agent_event(event)
+        result = await aprocess_agent_event(event)
 
         logger.info(f"✅ /app-open successful for user {user_id}")
         return result
@@ -202,7 +203,7 @@ async def checkin(
 
     try:
         event.user_id = user_id
-        result = process_agent_event(event)
+        result = await aprocess_agent_event(event)
 
         logger.info(f"✅ /checkin successful for user {user_id}")
         return result
@@ -231,7 +232,7 @@ async def do_action(
 
     try:
         event.user_id = user_id
-        result = process_agent_event(event)
+        result = await aprocess_agent_event(event)
 
         logger.info(f"✅ /do-action successful for user {user_id}")
         return result
@@ -258,7 +259,7 @@ async def day_end(
 
     try:
         event.user_id = user_id
-        result = process_agent_event(event)
+        result = await aprocess_agent_event(event)
 
         logger.info(f"✅ /day-end successful for user {user_id}")
         return result
@@ -286,12 +287,13 @@ async def get_insights(
     logger.info(f"💡 /insights request from user {user_id} for project {request.project_id}")
 
     try:
-        insights = generate_project_insights(user_id, request)
+        insights = await asyncio.to_thread(generate_project_insights, user_id, request)
 
         logger.info(f"✅ /insights successful for user {user_id}")
         return AgentMVPResponse(
             success=True,
-            data={"insights": [i.model_dump() for i in insights.insights]},
+            # Response serialization dumps these; no separate model_dump pass
+            data={"insights": insights.insights},
         )
 
     except Exception as e:
@@ -374,14 +376,14 @@ async def simulate(
         logger.info(f"📋 Mock state created with {len(state.candidates)} tasks")
 
         # Run node sequence (skip load_candidates & derive_constraints since we mocked)
-        state = llm_select_do(state)
+        state = await asyncio.to_thread(llm_select_do, state)
         if state.error:
             return AgentMVPResponse(
                 success=False,
                 error=state.error,
             )
 
-        state = llm_coach(state)
+        state = await asyncio.to_thread(llm_coach, state)
         if state.error:
             return AgentMVPResponse(
                 success=False,
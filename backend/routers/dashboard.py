@@ -4,7 +4,7 @@ from typing import Optional
 from core.supabase import get_supabase_admin
 from core.security import get_current_user
 from agent_mvp.contracts import AppOpenEvent, DayEndEvent
-from agent_mvp.orchestrator import process_agent_event
+from agent_mvp.orchestrator import aprocess_agent_event
 from opik import track
 import logging
 import re
@@ -94,7 +94,7 @@ async def get_dashboard_summary(
                 timestamp=now.isoformat(),
                 current_time=now,
             )
-            agent_result = process_agent_event(app_open_event)
+            agent_result = await aprocess_agent_event(app_open_event)
             logger.info(f"📱 APP_OPEN event processed for user {user_id}: {agent_result.get('success')}")
         except Exception as agent_err:
             logger.warning(f"APP_OPEN agent event failed (non-blocking): {agent_err}")
@@ -407,7 +407,7 @@ async def get_today_tasks(
             timestamp=now.isoformat(),
             context="today_tasks",
         )
-        agent_result = process_agent_event(do_next_event)
+        agent_result = await aprocess_agent_event(do_next_event)
         logger.info(f"🎯 DO_NEXT event processed for today-tasks: {agent_result.get('success')}")
 
         if agent_result.get('success') and agent_result.get('data'):
@@ -586,7 +586,7 @@ async def done_for_today(
                 user_id=user_id,
                 timestamp=now.isoformat(),
             )
-            agent_result = process_agent_event(day_end_event)
+            agent_result = await aprocess_agent_event(day_end_event)
             logger.info(f"🌅 DAY_END event processed for user {user_id}: {agent_result.get('success')}")
             if agent_result.get('success') and agent_result.get('data'):
                 agent_insights = agent_result['data'].get('day_insights')
@@ -17,6 +17,7 @@ from models.project import (
 from core.supabase import get_supabase, get_supabase_admin
 from core.config import get_settings
 from core.security import get_current_user
+from agent_mvp.orchestrator import invalidate_task_candidates
 from opik import track
 import logging
 
@@ -260,6 +261,7 @@ async def create_project(
                         logger.info(f"Created task: {task_title} -> {result.data}")
                     except Exception as task_err:
                         logger.error(f"Failed to create task '{task_title}': {task_err}", exc_info=True)
+                invalidate_task_candidates(current_user["id"])
 
         return {
             "success": True,
@@ -534,6 +536,7 @@ async def update_project(
                 tasks_to_delete = existing_task_ids - request_task_ids
                 for task_id in tasks_to_delete:
                     supabase.table("tasks").delete().eq("id", task_id).execute()
+                invalidate_task_candidates(current_user["id"])
 
                 # Auto-complete project if all tasks are completed
                 if request.tasks:
@@ -633,6 +636,7 @@ async def delete_project(
         if permanent:
             # Hard delete - cascades to tasks, details, etc.
             supabase.table("projects").delete().eq("id", str(project_id)).execute()
+            invalidate_task_candidates(current_user["id"])
             return {
                 "success": True,
                 "message": "Project permanently deleted",
@@ -1306,6 +1310,7 @@ async def create_project_with_files(
                             supabase.table("tasks").insert(task_data).execute()
                         except Exception as task_err:
                             logger.warning(f"Failed to create task: {task_err}")
+                    invalidate_task_candidates(current_user["id"])
             except json.JSONDecodeError:
                 logger.warning(f"Invalid JSON in details field: {details}")
 
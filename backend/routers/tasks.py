@@ -19,7 +19,7 @@ from models.task import (
 from core.supabase import get_supabase_admin
 from core.security import get_current_user
 from agent_mvp.contracts import DoActionEvent
-from agent_mvp.orchestrator import process_agent_event
+from agent_mvp.orchestrator import aprocess_agent_event, invalidate_task_candidates
 from opik import track
 import logging
 
@@ -243,6 +243,7 @@ async def create_task(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to create task",
             )
+        invalidate_task_candidates(current_user["id"])
 
         return {
             "success": True,
@@ -340,6 +341,7 @@ async def update_task(
             .eq("id", task_id)
             .execute()
         )
+        invalidate_task_candidates(current_user["id"])
 
         return {
             "success": True,
@@ -384,6 +386,7 @@ async def delete_task(
 
         # Delete the task
         supabase.table("tasks").delete().eq("id", task_id).execute()
+        invalidate_task_candidates(current_user["id"])
 
         return {
             "success": True,
@@ -427,6 +430,7 @@ async def update_task_status(
             .eq("id", task_id)
             .execute()
         )
+        invalidate_task_candidates(current_user["id"])
 
         return {
             "success": True,
@@ -460,6 +464,7 @@ async def update_task_priority(
             .eq("id", task_id)
             .execute()
         )
+        invalidate_task_candidates(current_user["id"])
 
         return {
             "success": True,
@@ -548,7 +553,7 @@ async def start_task(
                 action="start",
                 task_id=task_id,
             )
-            agent_result = process_agent_event(do_action_event)
+            agent_result = await aprocess_agent_event(do_action_event)
             logger.info(f"⚡ DO_ACTION(start) event processed for task {task_id}: {agent_result.get('success')}")
         except Exception as agent_err:
             logger.warning(f"DO_ACTION(start) agent event failed (non-blocking): {agent_err}")
@@ -613,7 +618,7 @@ async def pause_task(
                 action="pause",
                 task_id=task_id,
             )
-            agent_result = process_agent_event(do_action_event)
+            agent_result = await aprocess_agent_event(do_action_event)
             logger.info(f"⚡ DO_ACTION(pause) event processed for task {task_id}: {agent_result.get('success')}")
         except Exception as agent_err:
             logger.warning(f"DO_ACTION(pause) agent event failed (non-blocking): {agent_err}")
@@ -719,7 +724,7 @@ async def complete_task(
                 action="complete",
                 task_id=task_id,
             )
-            agent_result = process_agent_event(do_action_event)
+            agent_result = await aprocess_agent_event(do_action_event)
             logger.info(f"⚡ DO_ACTION(complete) event processed for task {task_id}: {agent_result.get('success')}")
             # Get motivation message from agent result
             if agent_result.get('success') and agent_result.get('data'):
@@ -857,7 +862,7 @@ async def report_intervention(
                     current_session=session,
                     time_stuck=request.time_stuck if hasattr(request, 'time_stuck') else None,
                 )
-                agent_result = process_agent_event(do_action_event)
+                agent_result = await aprocess_agent_event(do_action_event)
                 logger.info(f"⚡ DO_ACTION(stuck) event processed for task {task_id}: {agent_result.get('success')}")
                 # Get microtasks from agent result
                 if agent_result.get('success') and agent_result.get('data'):
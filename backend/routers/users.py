@@ -12,12 +12,10 @@ from models.user import (
 from core.supabase import get_supabase, get_supabase_admin
 from core.security import get_current_user
 from agent_mvp.contracts import CheckInSubmittedEvent
-from agent_mvp.orchestrator import process_agent_event
+from agent_mvp.orchestrator import process_agent_event, aprocess_agent_event
 from datetime import datetime, timezone, date
 from opik import track
 import logging
-from agent_mvp.orchestrator import process_agent_event
-from agent_mvp.contracts import CheckInSubmittedEvent
 
 logger = logging.getLogger(__name__)
 
@@ -301,7 +299,7 @@ async def daily_check_in(
                 time_available=getattr(request, "time_available", None),
                 timestamp=datetime.now(timezone.utc).isoformat(),
             )
-            agent_result = process_agent_event(checkin_event)
+            agent_result = await aprocess_agent_event(checkin_event)
             logger.info(f"📝 CHECKIN_SUBMITTED event processed for user {current_user['id']}: {agent_result.get('success')}")
             # Get constraints from agent result
             if agent_result.get('success') and agent_result.get('data'):
@@ -380,7 +378,7 @@ async def trigger_agent_debug(
             }
         
         logger.info(f"🤖 DEBUG: AGENTS_INVOKED event_type={event_type} user_id={user_id}")
-        result = process_agent_event(event)
+        result = await aprocess_agent_event(event)
         logger.info(f"🤖 DEBUG: AGENTS_DONE event_type={event_type} user_id={user_id}")
         
         return {
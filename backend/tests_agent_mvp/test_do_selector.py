@@ -219,6 +219,23 @@ class TestDoSelector:
 
         assert out1.task_id == out2.task_id == "a"
 
+    def test_select_optimal_task_alternates_skip_selected(self):
+        constraints = SelectionConstraints(max_minutes=30, current_energy=3, mode="balanced")
+        scored_candidates = [
+            {"task": {"id": "long-1", "title": "Long 1", "estimated_duration": 90}, "score": 90},
+            {"task": {"id": "long-2", "title": "Long 2", "estimated_duration": 90}, "score": 85},
+            {"task": {"id": "long-3", "title": "Long 3", "estimated_duration": 90}, "score": 80},
+            {"task": {"id": "short", "title": "Short", "estimated_duration": 20}, "score": 10},
+        ]
+
+        output = select_optimal_task(
+            {"user_id": "test-user", "candidates": scored_candidates, "constraints": constraints}
+        )
+
+        assert output.task_id == "short"
+        assert output.alt_task_ids == ["long-1", "long-2"]
+        assert output.reason_codes[0] == "constraints_fit"
+
     def test_opik_trace_smoke(self):
         constraints = SelectionConstraints(max_minutes=45, current_energy=3, mode="balanced")
         scored_candidates = [
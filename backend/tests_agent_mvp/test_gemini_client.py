@@ -0,0 +1,58 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from agent_mvp.gemini_client import GeminiClient
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+    with patch("agent_mvp.gemini_client.genai"):
+        yield GeminiClient(max_concurrency=2)
+
+
+def test_concurrent_requests_are_capped(client):
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def generate_content(**kwargs):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        return MagicMock(text="ok")
+
+    client.client.models.generate_content.side_effect = generate_content
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda i: client.generate_text(f"prompt {i}"), range(8)))
+
+    assert results == ["ok"] * 8
+    assert peak == 2
+
+
+def test_only_valid_json_is_cached_for_callers_that_opt_in(client):
+    client._cache.ttl = 60
+    generate = client.client.models.generate_content
+    generate.side_effect = [
+        MagicMock(text="not json"),
+        MagicMock(text='{"ok": true}'),
+        MagicMock(text='{"ok": false}'),
+    ]
+
+    with pytest.raises(ValueError):
+        client.generate_json_response("Return JSON", cache=True)
+    assert client.generate_json_response("Return JSON", cache=True) == {"ok": True}
+    assert client.generate_json_response("Return JSON", cache=True) == {"ok": True}
+    assert generate.call_count == 2
+
+    assert client.generate_json_response("Return JSON") == {"ok": False}
+    assert generate.call_count == 3
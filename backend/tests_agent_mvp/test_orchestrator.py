@@ -1,9 +1,20 @@
+import asyncio
+import threading
 import pytest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
-from agent_mvp.orchestrator import RaimonOrchestrator
+from pydantic import ValidationError
+from agent_mvp.orchestrator import (
+    RaimonOrchestrator, _shortlist_candidates, MAX_LLM_CANDIDATES, _RESPONSE_ADAPTER,
+    _get_orchestrator, aprocess_agent_event, _dump_list,
+    _build_constraints_from_checkin, _cached_checkin_constraints, _to_task_candidates,
+    _compiled_graph,
+)
 from agent_mvp.contracts import (
     AppOpenEvent, CheckInSubmittedEvent, DoActionEvent,
-    DayEndEvent, UserProfile, GamificationState
+    DayEndEvent, DoNextEvent, UserProfile, GamificationState, TaskCandidate,
+    SelectionConstraints, GraphState, Microtask, StuckAnalysis,
 )
 
 
@@ -38,7 +49,6 @@ class TestRaimonOrchestrator:
     def test_process_app_open_event(self, mock_supabase, orchestrator, mock_storage, mock_agents):
         # Setup
         event = AppOpenEvent(user_id="test-user", timestamp="2024-01-01T00:00:00Z")
-        mock_storage.get_session_state.return_value = None
         mock_agents['context_continuity_agent'].process.return_value = {"resumed": False}
 
         with patch.object(orchestrator, 'storage', mock_storage), \
@@ -49,7 +59,7 @@ class TestRaimonOrchestrator:
 
             # Assert
             assert result["event_type"] == "APP_OPEN"
-            mock_storage.get_session_state.assert_called_once_with("test-user")
+            mock_storage.get_session_state.assert_not_called()
             mock_agents['context_continuity_agent'].process.assert_called_once()
             mock_agents['events'].log_event.assert_called_once()
 
@@ -88,7 +98,6 @@ class TestRaimonOrchestrator:
             task_id="task-123",
             timestamp="2024-01-01T00:00:00Z"
         )
-        mock_storage.get_active_do.return_value = {"task": {"id": "task-123"}}
 
         with patch.object(orchestrator, 'storage', mock_storage), \
              patch.object(orchestrator, 'agents', mock_agents):
@@ -98,7 +107,8 @@ class TestRaimonOrchestrator:
 
             # Assert
             assert result["event_type"] == "DO_ACTION"
-            mock_storage.get_active_do.assert_called_once_with("test-user")
+            mock_storage.get_active_do.assert_not_called()
+            mock_storage.update_session_status.assert_called_once_with("task-123", "started")
             mock_agents['events'].log_event.assert_called_once()
 
     @patch('agent_mvp.orchestrator.get_supabase')
@@ -122,6 +132,184 @@ class TestRaimonOrchestrator:
             mock_agents['gamification_rules'].update_xp.assert_called_once()
             mock_storage.save_insights.assert_called_once()
 
+    @patch('agent_mvp.orchestrator.get_supabase')
+    def test_day_end_keeps_motivation_when_insights_fail(self, mock_supabase, orchestrator, mock_storage, mock_agents):
+        event = DayEndEvent(user_id="test-user", timestamp="2024-01-01T00:00:00Z")
+        mock_agents['project_insight_agent'] = MagicMock()
+        mock_agents['project_insight_agent'].generate_insights.side_effect = RuntimeError("LLM down")
+        mock_agents['motivation_agent'] = MagicMock()
+        mock_agents['motivation_agent'].generate_message.return_value = "Great job!"
+
+        with patch.object(orchestrator, 'storage', mock_storage), \
+             patch.object(orchestrator, 'agents', mock_agents):
+            result = orchestrator.process_event(event)
+
+        assert result["success"] is True
+        assert result["data"]["motivation_message"] == "Great job!"
+        mock_storage.save_insights.assert_not_called()
+
+    @patch('agent_mvp.orchestrator.log_agent_event')
+    @patch('agent_mvp.orchestrator.get_task_candidates', return_value=[])
+    @patch('agent_mvp.orchestrator.get_calendar_context', return_value=None)
+    @patch('agent_mvp.orchestrator.analyze_user_profile', return_value={})
+    def test_do_next_without_candidates_logs_event_once(
+        self, mock_profile, mock_calendar, mock_candidates, mock_log, orchestrator
+    ):
+        event = DoNextEvent(
+            user_id="test-user",
+            timestamp="2024-01-01T00:00:00Z",
+            constraints=SelectionConstraints(),
+        )
+
+        result = orchestrator.process_event(event)
+
+        assert result["success"] is False
+        assert result["error"] == "No task candidates available"
+        mock_log.assert_called_once_with("test-user", "do_next", {"context": "task_selection"})
+        mock_profile.assert_called_once()
+        assert mock_profile.call_args.args[0] == "test-user"
+
+    def test_known_event_skips_graph_invoke(self, orchestrator, mock_agents):
+        event = AppOpenEvent(user_id="test-user", timestamp="2024-01-01T00:00:00Z")
+
+        with patch.object(orchestrator, 'graph') as mock_graph, \
+             patch.object(orchestrator, 'agents', mock_agents):
+            result = orchestrator.process_event(event)
+
+        assert result["event_type"] == "APP_OPEN"
+        mock_graph.invoke.assert_not_called()
+
+    def test_graph_is_built_on_first_use(self, orchestrator):
+        assert 'graph' not in vars(orchestrator)
+        assert orchestrator.graph is orchestrator.graph
+
+    def test_error_response_matches_response_schema(self, orchestrator):
+        event = AppOpenEvent(user_id="test-user", timestamp="2024-01-01T00:00:00Z")
+        failing = MagicMock(side_effect=RuntimeError("boom"))
+
+        with patch.dict(orchestrator._event_fast_path, {"APP_OPEN": failing}):
+            result = orchestrator.process_event(event)
+
+        body = {k: v for k, v in result.items() if k != "event_type"}
+        round_trip = _RESPONSE_ADAPTER.dump_python(
+            _RESPONSE_ADAPTER.validate_python(body), exclude_none=True
+        )
+        assert body == round_trip
+        assert result["error"] == "Orchestration failed: boom"
+        assert result["event_type"] == "APP_OPEN"
+
+    def test_background_writer_flushes_queued_writes(self, orchestrator, mock_storage, mock_agents):
+        event = DoActionEvent(
+            user_id="test-user",
+            action="start",
+            task_id="task-123",
+            timestamp="2024-01-01T00:00:00Z"
+        )
+
+        with patch.object(orchestrator, 'storage', mock_storage), \
+             patch.object(orchestrator, 'agents', mock_agents):
+            orchestrator._start_writer()
+            result = orchestrator.process_event(event)
+            orchestrator._flush_writes()
+
+        assert result["success"] is True
+        mock_storage.update_session_status.assert_called_once_with("task-123", "started")
+
+    @patch('agent_mvp.orchestrator.log_agent_event')
+    @patch('agent_mvp.orchestrator.get_task_candidates', return_value=[])
+    @patch('agent_mvp.orchestrator.get_calendar_context', return_value=None)
+    @patch('agent_mvp.orchestrator.analyze_user_profile', return_value={})
+    def test_background_writer_batches_agent_events(
+        self, mock_profile, mock_calendar, mock_candidates, mock_log, orchestrator, mock_storage
+    ):
+        event = DoNextEvent(
+            user_id="test-user",
+            timestamp="2024-01-01T00:00:00Z",
+            constraints=SelectionConstraints(),
+        )
+
+        with patch.object(orchestrator, 'storage', mock_storage):
+            orchestrator._start_writer()
+            orchestrator.process_event(event)
+            orchestrator.process_event(event)
+            orchestrator._flush_writes()
+
+        mock_log.assert_not_called()
+        mock_storage.log_agent_events.assert_called_once()
+        (rows,), _ = mock_storage.log_agent_events.call_args
+        assert [row["event_type"] for row in rows] == ["do_next", "do_next"]
+
+    @patch('agent_mvp.orchestrator.log_agent_events')
+    @patch('agent_mvp.orchestrator.update_session_status')
+    def test_null_storage_drops_writes_but_records_starts(self, mock_update, mock_log_events, orchestrator):
+        orchestrator.storage = None
+        row = {"user_id": "test-user", "event_type": "do_next", "event_data": {}}
+        orchestrator._apply_writes([("log_agent_event", (row,))])
+        mock_log_events.assert_called_once_with([row])
+
+        event = DoActionEvent(user_id="test-user", action="start", task_id="task-123")
+        result = orchestrator.process_event(event)
+
+        assert result["success"] is True
+        mock_update.assert_called_once_with("task-123", "started")
+
+    @patch('agent_mvp.orchestrator.finalize_selection')
+    def test_null_storage_still_finalizes_selections(self, mock_finalize, orchestrator):
+        orchestrator.storage = None
+        active_do = {"user_id": "test-user", "task": {"task_id": "task-123"}}
+
+        orchestrator._write_behind("finalize_selection", active_do, None)
+
+        mock_finalize.assert_called_once_with(active_do, None)
+
+    def test_apply_writes_coalesces_active_do_saves(self, orchestrator):
+        storage = MagicMock()
+        orchestrator.storage = storage
+        first = {"user_id": "u1", "task": {"id": "t1"}}
+        latest = {"user_id": "u1", "task": {"id": "t2"}}
+        other = {"user_id": "u2", "task": {"id": "t3"}}
+
+        orchestrator._apply_writes([
+            ("save_active_do", (first,)),
+            ("save_active_do", (other,)),
+            ("update_session_status", ("t9", "started")),
+            ("save_active_do", (latest,)),
+        ])
+
+        storage.save_active_do.assert_not_called()
+        storage.save_active_dos.assert_called_once_with([latest, other])
+        storage.update_session_status.assert_called_once_with("t9", "started")
+
+    @patch('agent_mvp.orchestrator.llm_generate_coaching_message', side_effect=RuntimeError("no llm"))
+    @patch('agent_mvp.orchestrator.llm_select_task', side_effect=RuntimeError("no llm"))
+    @patch('agent_mvp.orchestrator.get_task_candidates', return_value=[
+        {"id": "task-1", "title": "Write tests", "priority": "high", "estimated_duration": 20},
+    ])
+    @patch('agent_mvp.orchestrator.get_calendar_context', return_value=None)
+    @patch('agent_mvp.orchestrator.analyze_user_profile', return_value={})
+    def test_do_next_queues_finalize_selection(
+        self, mock_profile, mock_calendar, mock_candidates, mock_select, mock_coach, orchestrator
+    ):
+        storage = MagicMock()
+        event = DoNextEvent(
+            user_id="test-user",
+            timestamp="2024-01-01T00:00:00Z",
+            constraints=SelectionConstraints(),
+        )
+
+        with patch.object(orchestrator, 'storage', storage):
+            orchestrator._start_writer()
+            result = orchestrator.process_event(event)
+            orchestrator._flush_writes()
+
+        assert result["success"] is True
+        storage.finalize_selection.assert_called_once()
+        row, agent_event = storage.finalize_selection.call_args.args
+        assert row["task"]["id"] == "task-1"
+        assert agent_event["event_type"] == "do_next"
+        selected_at = result["data"]["active_do"]["selected_at"]
+        assert selected_at.isoformat() == row["started_at"] == row["task"]["_agent_meta"]["selected_at"]
+
     def test_invalid_event_type(self, orchestrator):
         # Setup
         event = MagicMock()
@@ -129,4 +317,213 @@ class TestRaimonOrchestrator:
 
         # Execute & Assert
         with pytest.raises(ValueError, match="Unknown event type"):
-            orchestrator.process_event(event)
\ No newline at end of file
+            orchestrator.process_event(event)
+
+
+def test_shortlist_candidates_caps_llm_prompt():
+    tasks = [
+        TaskCandidate(id=f"t{i}", title=f"Task {i}", priority="low", estimated_duration=30)
+        for i in range(MAX_LLM_CANDIDATES + 5)
+    ]
+    tasks.append(TaskCandidate(id="urgent", title="Urgent task", priority="urgent"))
+
+    shortlist = _shortlist_candidates(tasks)
+
+    assert len(shortlist) == MAX_LLM_CANDIDATES
+    assert shortlist[0].id == "urgent"
+    assert _shortlist_candidates(tasks[:3]) == tasks[:3]
+
+
+def test_run_independent_preserves_order_with_pool():
+    orchestrator = RaimonOrchestrator()
+    orchestrator._io_pool = ThreadPoolExecutor(max_workers=2)
+    try:
+        assert orchestrator._run_independent(lambda: "insights", lambda: "motivation") == [
+            "insights", "motivation"
+        ]
+    finally:
+        orchestrator._io_pool.shutdown()
+
+
+def test_run_independent_can_return_exceptions():
+    def fail():
+        raise RuntimeError("boom")
+
+    orchestrator = RaimonOrchestrator()
+    first, second = orchestrator._run_independent(fail, lambda: "motivation", return_exceptions=True)
+    assert isinstance(first, RuntimeError)
+    assert second == "motivation"
+    with pytest.raises(RuntimeError):
+        orchestrator._run_independent(fail, lambda: "motivation")
+
+
+def test_get_orchestrator_returns_shared_instance():
+    assert _get_orchestrator() is _get_orchestrator()
+
+
+@patch('agent_mvp.orchestrator.process_agent_event')
+def test_aprocess_agent_event_runs_off_the_event_loop(mock_process):
+    loop_thread = threading.get_ident()
+    mock_process.side_effect = lambda event: {"success": True, "thread": threading.get_ident()}
+
+    result = asyncio.run(aprocess_agent_event(object()))
+
+    assert result["success"] is True
+    assert result["thread"] != loop_thread
+
+
+def test_graph_state_round_trips_from_graph_dict():
+    event = AppOpenEvent(user_id="test-user", timestamp="2024-01-01T00:00:00Z")
+    state = GraphState(
+        user_id="test-user",
+        current_event=event,
+        event_type_str="APP_OPEN",
+        success=True,
+        motivation_message="Nice work!",
+    )
+
+    rebuilt = GraphState.model_validate(dict(state))
+
+    assert rebuilt.model_dump() == state.model_dump()
+    with pytest.raises(ValueError):
+        GraphState.model_validate({**dict(state), "unknown_field": 1})
+
+
+def test_event_type_tag_is_inherited_and_fixed():
+    class TimedAppOpenEvent(AppOpenEvent):
+        pass
+
+    assert AppOpenEvent(user_id="test-user").event_type == "APP_OPEN"
+    assert TimedAppOpenEvent(user_id="test-user").event_type == "APP_OPEN"
+    with pytest.raises(ValidationError):
+        AppOpenEvent(user_id="test-user", event_type="DAY_END")
+
+
+def test_dump_list_serializes_by_list_head():
+    microtasks = [Microtask(description="Write one line"), Microtask(description="Open the file")]
+    raw = [{"content": "Keep going"}]
+
+    assert _dump_list(microtasks) == [m.model_dump() for m in microtasks]
+    assert _dump_list(raw) == raw
+
+
+def test_stuck_microtasks_are_serialized_once():
+    microtasks = [Microtask(description="Write one line")]
+    analysis = StuckAnalysis(is_stuck=True, microtasks=microtasks)
+    state = GraphState(user_id="test-user")
+    state.stuck_analysis = analysis
+    state.microtasks = analysis.microtasks  # as _handle_do_action assigns them
+
+    data = RaimonOrchestrator()._extract_response_data(state)
+
+    assert data["microtasks"] == [microtasks[0].model_dump()]
+    assert data["microtasks"] is data["stuck_analysis"]["microtasks"]
+
+
+@patch('agent_mvp.orchestrator.adapt_checkin_to_constraints')
+def test_checkin_constraints_are_memoized_per_checkin(mock_adapt):
+    _cached_checkin_constraints.cache_clear()
+    mock_adapt.return_value = SelectionConstraints(current_energy=7)
+    row = {"date": "2024-01-01", "energy_level": 7, "focus_areas": ["work"]}
+
+    first = _build_constraints_from_checkin("test-user", row, "2024-01-01", 0)
+    second = _build_constraints_from_checkin("test-user", dict(row), "2024-01-01", 0)
+
+    mock_adapt.assert_called_once()
+    assert first == second
+    assert first is not second
+    _cached_checkin_constraints.cache_clear()
+
+
+def test_route_event_sends_subclassed_events_to_their_handler():
+    class TimedDayEndEvent(DayEndEvent):
+        pass
+
+    orchestrator = RaimonOrchestrator()
+    event = TimedDayEndEvent(user_id="test-user", timestamp="2024-01-01T00:00:00Z")
+
+    assert orchestrator._route_event(GraphState(user_id="test-user", current_event=event)) == "day_end"
+    assert orchestrator._route_event(GraphState(user_id="test-user", current_event=object())) == "error"
+
+
+def test_graph_start_node_jumps_to_handler():
+    class TimedDayEndEvent(DayEndEvent):
+        pass
+
+    orchestrator = RaimonOrchestrator()
+    with patch.object(orchestrator, '_handle_day_end', side_effect=lambda s: s) as mock_handler:
+        event = TimedDayEndEvent(user_id="test-user", timestamp="2024-01-01T00:00:00Z")
+        orchestrator.graph.invoke(GraphState(user_id="test-user", current_event=event))
+    mock_handler.assert_called_once()
+
+    result = orchestrator.graph.invoke(GraphState(user_id="test-user", current_event=object()))
+    assert result["success"] is False
+    assert result["error"].startswith("Unknown event type")
+
+
+def test_orchestrators_share_one_compiled_graph():
+    first, second = RaimonOrchestrator(), RaimonOrchestrator()
+    event = DayEndEvent(user_id="test-user", timestamp="2024-01-01T00:00:00Z")
+
+    with patch.object(first, '_handle_day_end', side_effect=lambda s: s) as first_handler, \
+         patch.object(second, '_handle_day_end', side_effect=lambda s: s) as second_handler:
+        second.graph.invoke(GraphState(user_id="test-user", current_event=event))
+        first.graph.invoke(GraphState(user_id="test-user", current_event=event))
+
+    first_handler.assert_called_once()
+    second_handler.assert_called_once()
+    assert _compiled_graph.cache_info().currsize == 1
+
+
+def test_to_task_candidates_drops_only_invalid_rows():
+    rows = [
+        {"id": 1, "title": "Write report", "priority": "high", "due_at": "2024-01-02T00:00:00Z"},
+        {"id": 2, "title": "Too long", "estimated_duration": 5000},
+        {"id": 3, "title": None, "estimated_minutes": 25},
+    ]
+
+    assert [c.id for c in _to_task_candidates(rows[::2])] == ["1", "3"]
+    candidates = _to_task_candidates(rows)
+    assert [c.id for c in candidates] == ["1", "3"]
+    assert candidates[1].title == "Untitled task"
+    assert candidates[1].estimated_duration == 25
+
+
+@patch('agent_mvp.orchestrator.get_task_candidates')
+def test_task_candidates_are_cached_until_the_user_acts(mock_get_candidates):
+    mock_get_candidates.return_value = [{"id": "task-1", "title": "Write report"}]
+    orchestrator = RaimonOrchestrator()
+    orchestrator._candidate_cache.ttl = 30
+    constraints = SelectionConstraints(max_minutes=30, mode="quick", current_energy=4)
+
+    first = orchestrator._get_task_candidates("test-user", constraints)
+    second = orchestrator._get_task_candidates("test-user", constraints.model_copy())
+    assert first == second
+    assert first is not second
+    assert mock_get_candidates.call_count == 1
+
+    orchestrator._invalidate_task_candidates("test-user")
+    orchestrator._get_task_candidates("test-user", constraints)
+    assert mock_get_candidates.call_count == 2
+
+
+@patch('agent_mvp.orchestrator._fetch_today_checkin')
+def test_checkin_is_cached_until_a_new_checkin(mock_checkin):
+    orchestrator = RaimonOrchestrator()
+    orchestrator._checkin_cache.ttl = 60
+    today = datetime.now(timezone.utc).date().isoformat()
+
+    mock_checkin.return_value = None
+    assert orchestrator._get_today_checkin("test-user", today) is None
+    assert orchestrator._get_today_checkin("test-user", today) is None
+    assert mock_checkin.call_count == 2
+
+    mock_checkin.return_value = {"energy_level": 6}
+    assert orchestrator._get_today_checkin("test-user", today) == {"energy_level": 6}
+    assert orchestrator._get_today_checkin("test-user", today) == {"energy_level": 6}
+    assert mock_checkin.call_count == 3
+
+    event = CheckInSubmittedEvent(user_id="test-user", energy_level=6, time_available=60, timestamp=today)
+    orchestrator._handle_checkin(GraphState(user_id="test-user", current_event=event))
+    orchestrator._get_today_checkin("test-user", today)
+    assert mock_checkin.call_count == 4
@@ -0,0 +1,33 @@
+from agent_mvp.project_insight_agent import (
+    _checkin_energy_index,
+    _generate_general_insights,
+    _get_session_energy,
+)
+
+
+def test_session_energy_uses_the_nearest_checkin_within_two_hours():
+    # Deliberately unsorted; the index orders them by time
+    times, energies = _checkin_energy_index([
+        {"created_at": "2024-01-01T15:00:00Z", "energy_level": 4},
+        {"created_at": "2024-01-01T09:00:00Z", "energy_level": 2},
+        {"created_at": "2024-01-01T12:00:00+00:00", "energy_level": 5},
+    ])
+    assert energies == [2, 5, 4]
+
+    def energy(start_time):
+        return _get_session_energy({"start_time": start_time}, times, energies)
+
+    assert energy("2024-01-01T12:00:00Z") == 5  # exact match
+    assert energy("2024-01-01T13:00:00Z") == 5  # nearest is the earlier check-in
+    assert energy("2024-01-01T14:30:00Z") == 4  # nearest is the later check-in
+    assert energy("2024-01-01T08:00:00Z") == 2  # before any check-in
+    assert energy("2024-01-01T06:00:00Z") == 3  # nothing within 2 hours
+    assert energy(None) == 3
+
+
+def test_non_string_timestamps_are_skipped():
+    sessions = [{"start_time": {"hour": 9}}, {"start_time": ["2024-01-01"]}]
+    assert _generate_general_insights({"name": "x"}, [], sessions) == []
+
+    checkins = [{"created_at": {"hour": 9}, "energy_level": 5}]
+    assert _checkin_energy_index(checkins) == ([], [])
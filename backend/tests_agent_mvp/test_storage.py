@@ -0,0 +1,30 @@
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from agent_mvp.storage import get_project_bundle
+
+
+@patch('agent_mvp.storage.get_project_tasks')
+@patch('agent_mvp.storage.get_project_data', return_value=None)
+def test_project_bundle_stops_when_the_project_is_not_found(mock_project, mock_tasks):
+    assert get_project_bundle("project-1", "test-user", checkin_days=30) == (None, [], [], [])
+    mock_tasks.assert_not_called()
+
+
+def test_project_bundle_fetches_in_the_callers_context():
+    trace = contextvars.ContextVar("trace", default=None)
+    trace.set("request-trace")
+
+    def seen(*args):
+        return [trace.get()]
+
+    with ThreadPoolExecutor(max_workers=3) as pool, \
+            patch('agent_mvp.storage._get_project_io_pool', return_value=pool), \
+            patch('agent_mvp.storage.get_project_data', return_value={"id": "project-1"}), \
+            patch('agent_mvp.storage.get_project_tasks', side_effect=seen), \
+            patch('agent_mvp.storage.get_project_sessions', side_effect=seen), \
+            patch('agent_mvp.storage.get_project_checkins', side_effect=seen):
+        bundle = get_project_bundle("project-1", "test-user", checkin_days=30)
+
+    assert bundle == ({"id": "project-1"}, ["request-trace"], ["request-trace"], ["request-trace"])
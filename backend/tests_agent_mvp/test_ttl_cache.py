@@ -0,0 +1,41 @@
+from unittest.mock import patch
+
+from agent_mvp.ttl_cache import TTLCache
+
+
+def test_get_returns_stored_value_until_it_expires():
+    cache = TTLCache(ttl=10, max_size=4)
+    with patch("agent_mvp.ttl_cache.time.monotonic", return_value=100.0):
+        cache.set("key", [1, 2])
+        assert cache.get("key") == [1, 2]
+        assert cache.get("missing", "default") == "default"
+
+    with patch("agent_mvp.ttl_cache.time.monotonic", return_value=110.0):
+        assert cache.get("key") is None
+
+
+def test_oldest_entry_is_evicted_and_refreshes_move_to_the_back():
+    cache = TTLCache(ttl=10, max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("a", 3)
+    cache.set("c", 4)
+
+    assert len(cache) == 2
+    assert cache.get("a") == 3
+    assert cache.get("b") is None
+    assert cache.get("c") == 4
+
+
+def test_invalidate_drops_a_group_and_eviction_forgets_empty_groups():
+    cache = TTLCache(ttl=10, max_size=2)
+    cache.set(("user-a", 1), "x", group="user-a")
+    cache.set(("user-a", 2), "y", group="user-a")
+    cache.invalidate("user-a")
+    assert len(cache) == 0
+
+    cache.set(("user-b", 1), "x", group="user-b")
+    cache.set(("user-c", 1), "y", group="user-c")
+    cache.set(("user-d", 1), "z", group="user-d")
+    assert cache.get(("user-b", 1)) is None
+    assert "user-b" not in cache._groups